@@ -1,42 +1,255 @@
+import hashlib
 import logging
+import threading
 from abc import abstractmethod
-from typing import List
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Tuple
 from functools import wraps
-from time import perf_counter
+from operator import attrgetter
+from time import perf_counter, perf_counter_ns
 
 
 from haystack import Document, BaseComponent
 
 logger = logging.getLogger(__name__)
 
+_get_id = attrgetter("id")
+_lazy_init_lock = threading.Lock()
+
+
+def _timer_overhead_ns(n: int = 1000) -> int:
+    """Lower bound of the cost of a perf_counter_ns() measurement, i.e. two back-to-back calls."""
+    overhead = []
+    for _ in range(n):
+        tic = perf_counter_ns()
+        overhead.append(perf_counter_ns() - tic)
+    return min(overhead)
+
+
+_TIMER_OVERHEAD_NS = _timer_overhead_ns()
+
 
 class BaseDocumentClassifier(BaseComponent):
     outgoing_edges = 1
+    # Only time every n-th query and scale the measurement by n. Raise for very hot components with cheap predict().
+    _timing_sample_rate = 1
+    # Micro-batching of concurrent run() calls. With max_latency_ms = 0 (default) every call runs predict() directly.
+    # Otherwise, documents from calls arriving within max_latency_ms of each other are classified in a single
+    # predict() call of up to max_batch documents and the results are scattered back to the callers.
+    max_batch = 64
+    max_latency_ms = 0
+    # Number of classification results kept in an LRU cache keyed on the document id and content. Documents seen
+    # before are not passed to predict() again. Set to 0 to disable caching.
+    cache_size = 10_000
+    model_version = None
+    # Attributes affecting the classification result. They are part of the cache key, so changing them on an
+    # instance doesn't return results cached for the previous setting.
+    cache_key_attributes: Tuple[str, ...] = ("model_version",)
+
     query_count = 0
-    query_time = 0
+    empty_query_count = 0
+    query_time_ns = 0
+    _pending_docs = 0
+    # Per-instance state created on first use by __getattr__(), so subclasses don't have to call __init__()
+    _lazy_attributes = {
+        "_batch_cond": threading.Condition,
+        "_pending": list,
+        "_cache": OrderedDict,
+        "_cache_lock": threading.Lock,
+    }
+
+    def __getattr__(self, name):
+        factory = self._lazy_attributes.get(name)
+        if factory is None:
+            return super().__getattr__(name)
+        with _lazy_init_lock:
+            if name not in self.__dict__:
+                self.__dict__[name] = factory()
+            return self.__dict__[name]
+
+    def __getstate__(self):
+        # locks can't be pickled or deep-copied, the copy creates its own on first use
+        state = self.__dict__.copy()
+        for name in ("_batch_cond", "_pending", "_cache_lock"):
+            state.pop(name, None)
+        return state
 
     @abstractmethod
     def predict(self, documents: List[Document]):
         pass
 
+    def predict_stream(self, documents: Iterable[Document], batch_size: int = 32) -> Iterator[Document]:
+        """
+        Classify documents in batches of `batch_size` and yield them as soon as their batch is done.
+        In contrast to predict(), only one batch of documents is held in memory at a time.
+
+        :param documents: Iterable of Documents to classify, e.g. a generator
+        :param batch_size: Number of documents passed to predict() at once
+        :return: Generator of Documents enriched with meta information
+        """
+        batch: List[Document] = []
+        for doc in documents:
+            batch.append(doc)
+            if len(batch) == batch_size:
+                yield from self.predict(documents=batch)
+                batch = []
+        if batch:
+            yield from self.predict(documents=batch)
+
     def run(self, query: str, documents: List[Document]): # type: ignore
+        if not documents:
+            # don't let calls without documents (e.g. the retriever found nothing) distort the per-query timings
+            self.empty_query_count += 1
+            return {"documents": []}, "output_1"
+
         self.query_count += 1
-        if documents:
-            predict = self.timing(self.predict, "query_time")
-            results = predict(documents=documents)
+        if self.cache_size > 0:
+            results = self._predict_cached(documents)
         else:
-            results = []
+            results = self._predict(documents)
 
-        document_ids = [doc.id for doc in results]
-        logger.debug(f"Retrieved documents with IDs: {document_ids}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Retrieved documents with IDs: %s", list(map(_get_id, results)))
         output = {"documents": results}
 
         return output, "output_1"
 
+    def _predict(self, documents: List[Document]) -> List[Document]:
+        if self.max_latency_ms > 0:
+            return self._predict_batched(documents)
+        with self._time("query_time_ns"):
+            return self.predict(documents=documents)
+
+    def _cache_key(self, doc: Document):
+        # ids are not guaranteed to change with the content (e.g. user supplied ids or updated documents)
+        content_hash = hashlib.blake2b(str(doc.content).encode(), digest_size=16).digest()
+        return self._cache_key_params(), doc.id, content_hash
+
+    def _cache_key_params(self) -> tuple:
+        params = []
+        for name in self.cache_key_attributes:
+            value = getattr(self, name, None)
+            params.append(tuple(value) if isinstance(value, list) else value)
+        return tuple(params)
+
+    def _predict_cached(self, documents: List[Document]) -> List[Document]:
+        """
+        Run predict() only on documents without a cached classification and restore the cached
+        `meta["classification"]` of all others.
+        """
+        keys = [self._cache_key(doc) for doc in documents]
+        hits = []
+        with self._cache_lock:
+            for doc, key in zip(documents, keys):
+                cached = self._cache.get(key)
+                hits.append(cached is not None)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    doc.meta["classification"] = cached.copy()
+
+        if all(hits):
+            return documents
+
+        predicted = iter(self._predict([doc for doc, hit in zip(documents, hits) if not hit]))
+        results = []
+        with self._cache_lock:
+            for doc, key, hit in zip(documents, keys, hits):
+                if hit:
+                    results.append(doc)
+                    continue
+                result = next(predicted)
+                if "classification" in result.meta:
+                    self._cache[key] = result.meta["classification"].copy()
+                results.append(result)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return results
+
+    def _predict_batched(self, documents: List[Document]) -> List[Document]:
+        """
+        Enqueue documents for a shared predict() call. The first caller of a batch waits up to max_latency_ms
+        (or until max_batch documents are pending), runs predict() on all pending documents and resolves the
+        futures of the other callers.
+        """
+        future: Future = Future()
+        with self._batch_cond:
+            self._pending.append((future, documents))
+            self._pending_docs += len(documents)
+            is_leader = len(self._pending) == 1
+            if is_leader:
+                self._batch_cond.wait_for(lambda: self._pending_docs >= self.max_batch,
+                                          timeout=self.max_latency_ms / 1000)
+                batch, self._pending, self._pending_docs = self._pending, [], 0
+            elif self._pending_docs >= self.max_batch:
+                self._batch_cond.notify_all()
+
+        if is_leader:
+            all_docs = [doc for _, docs in batch for doc in docs]
+            try:
+                with self._time("query_time_ns"):
+                    all_results = self.predict(documents=all_docs)
+            except Exception as e:
+                for f, _ in batch:
+                    f.set_exception(e)
+            else:
+                start = 0
+                for f, docs in batch:
+                    f.set_result(all_results[start:start + len(docs)])
+                    start += len(docs)
+
+        return future.result()
+
+    @property
+    def query_time(self) -> float:
+        """Accumulated time spent in predict() in seconds."""
+        return self.query_time_ns / 1e9
+
+    @query_time.setter
+    def query_time(self, value: float):
+        self.query_time_ns = int(value * 1e9)
+
+    @property
+    def timing_sample_rate(self) -> int:
+        """Only every n-th query is timed, its measurement is scaled by n."""
+        return self._timing_sample_rate
+
+    @timing_sample_rate.setter
+    def timing_sample_rate(self, value: int):
+        if not isinstance(value, int) or value < 1:
+            raise ValueError(f"timing_sample_rate must be an integer >= 1, got {value!r}")
+        self._timing_sample_rate = value
+
+    @contextmanager
+    def _time(self, attr_name: str):
+        """
+        Context manager adding the elapsed time of its body in nanoseconds to the attribute `attr_name`.
+        Only every `timing_sample_rate`-th query is measured, scaled by the sample rate.
+        """
+        if self.query_count % self.timing_sample_rate:
+            yield
+            return
+        tic = perf_counter_ns()
+        try:
+            yield
+        finally:
+            elapsed = (perf_counter_ns() - tic) * self.timing_sample_rate
+            setattr(self, attr_name, getattr(self, attr_name) + elapsed)
+
     def timing(self, fn, attr_name):
-        """Wrapper method used to time functions. """
+        """
+        Wrapper method used to time functions. Kept for backwards compatibility, run() uses `_time()`.
+        Time recorded for "query_time" is added to `query_time_ns`, which backs the `query_time` property.
+        """
         @wraps(fn)
         def wrapper(*args, **kwargs):
+            if attr_name == "query_time":
+                tic = perf_counter_ns()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self.query_time_ns += perf_counter_ns() - tic
             if attr_name not in self.__dict__:
                 self.__dict__[attr_name] = 0
             tic = perf_counter()
@@ -53,5 +266,11 @@ class BaseDocumentClassifier(BaseComponent):
             print("No querying performed via Classifier.run()")
         else:
             print(f"Queries Performed: {self.query_count}")
+            if self.empty_query_count:
+                print(f"Queries without documents (not included): {self.empty_query_count}")
             print(f"Query time: {self.query_time}s")
-            print(f"{self.query_time / self.query_count} seconds per query")
\ No newline at end of file
+            print(f"{self.query_time / self.query_count} seconds per query")
+            if self.query_time_ns:
+                overhead_pct = 100 * min(1.0, self.query_count * _TIMER_OVERHEAD_NS / self.query_time_ns)
+                if overhead_pct > 10:
+                    print(f"WARNING: timer overhead {overhead_pct:.1f}%, results unreliable")
@@ -1,6 +1,7 @@
 import logging
 from typing import List, Optional
 
+import torch
 from transformers import pipeline
 
 from haystack import Document
@@ -40,6 +41,8 @@ class TransformersDocumentClassifier(BaseDocumentClassifier):
      ```
     """
 
+    cache_key_attributes = ("model_version", "task", "labels", "return_all_scores")
+
     def __init__(
         self,
         model_name_or_path: str = "bhadresh-savani/distilbert-base-uncased-emotion",
@@ -77,6 +80,7 @@ class TransformersDocumentClassifier(BaseDocumentClassifier):
         or an entailment.
 
         """
+        super().__init__()
 
         # save init parameters to enable export of component config as YAML
         self.set_config(
@@ -93,10 +97,26 @@ class TransformersDocumentClassifier(BaseDocumentClassifier):
             self.model = pipeline(task=task, model=model_name_or_path, tokenizer=tokenizer, device=use_gpu, revision=model_version)
         elif task == 'text-classification':
             self.model = pipeline(task=task, model=model_name_or_path, tokenizer=tokenizer, device=use_gpu, revision=model_version, return_all_scores=return_all_scores)
+        self.model_version = model_version
         self.return_all_scores = return_all_scores
         self.labels = labels
         self.task = task
 
+    def quantize(self, dtype: torch.dtype = torch.qint8):
+        """
+        Apply dynamic quantization to all linear layers of the underlying model. Weights are stored as int8 and
+        activations are quantized on the fly, which speeds up inference on CPU at a small cost in accuracy.
+        Only supported for models running on CPU.
+
+        :param dtype: Target dtype of the quantized weights, `torch.qint8` or `torch.float16`.
+        """
+        if self.model.device.type != "cpu":
+            raise ValueError("Dynamic quantization is only supported for models running on CPU. "
+                             "Initialize the TransformersDocumentClassifier with use_gpu=-1.")
+        self.model.model = torch.quantization.quantize_dynamic(self.model.model, {torch.nn.Linear}, dtype=dtype)
+        # predictions of the quantized model may differ slightly, so don't mix them with cached ones
+        self._cache.clear()
+
     def predict(self, documents: List[Document]) -> List[Document]:
         """
         Returns documents containing classification result in meta field
@@ -105,19 +125,33 @@ class TransformersDocumentClassifier(BaseDocumentClassifier):
         :return: List of Document enriched with meta information
 
         """
-        texts = [doc.content for doc in documents]
-        if self.task == 'zero-shot-classification':
-            predictions = self.model(texts, candidate_labels=self.labels, truncation=True)
-        elif self.task == 'text-classification':
-            predictions = self.model(texts, return_all_scores=self.return_all_scores, truncation=True)
+        predictions = self.predict_batch(texts=[doc.content for doc in documents])
 
         classified_docs: List[Document] = []
 
         for prediction, doc in zip(predictions, documents):
             cur_doc = doc
             cur_doc.meta["classification"] = prediction
-            if self.task == 'zero-shot-classification':
-                cur_doc.meta["classification"]["label"] = cur_doc.meta["classification"]["labels"][0]
             classified_docs.append(cur_doc)
 
         return classified_docs
+
+    def predict_batch(self, texts: List[str]) -> List[dict]:
+        """
+        Classifies raw texts without wrapping them in Document objects.
+
+        :param texts: List of texts to classify
+        :return: List of classification results, one dictionary per text in the format of `meta["classification"]`
+
+        """
+        if self.task == 'zero-shot-classification':
+            predictions = self.model(texts, candidate_labels=self.labels, truncation=True)
+            # the pipeline returns a single dict instead of a list for a single text
+            if isinstance(predictions, dict):
+                predictions = [predictions]
+            for prediction in predictions:
+                prediction["label"] = prediction["labels"][0]
+        elif self.task == 'text-classification':
+            predictions = self.model(texts, return_all_scores=self.return_all_scores, truncation=True)
+
+        return predictions
@@ -409,7 +409,7 @@ class ElasticsearchDocumentStore(BaseDocumentStore):
             f"duplicate_documents parameter must be {', '.join(self.duplicate_documents_options)}"
 
         field_map = self._create_document_field_map()
-        document_objects = [Document.from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in documents]
+        document_objects = Document.from_dicts(documents, field_map=field_map)
         document_objects = self._handle_duplicate_documents(documents=document_objects,
                                                             index=index,
                                                             duplicate_documents=duplicate_documents)
@@ -418,7 +418,7 @@ class ElasticsearchDocumentStore(BaseDocumentStore):
             _doc = {
                 "_op_type": "index" if duplicate_documents == 'overwrite' else "create",
                 "_index": index,
-                **doc.to_dict(field_map=self._create_document_field_map())
+                **doc.to_dict(field_map=field_map)
             }  # type: Dict[str, Any]
 
             # cast embedding type as ES cannot deal with np.array
@@ -735,10 +735,12 @@ class ElasticsearchDocumentStore(BaseDocumentStore):
                     )
                 body["query"]["bool"]["filter"] = filter_clause
 
-        if self.excluded_meta_data:
-            body["_source"] = {"excludes": self.excluded_meta_data}
+        # don't transfer the stored embeddings of the hits unless they are returned
+        excluded_meta_data = self._get_excluded_fields(return_embedding=self.return_embedding)
+        if excluded_meta_data:
+            body["_source"] = {"excludes": excluded_meta_data}
 
-        logger.debug(f"Retriever query: {body}")
+        logger.debug("Retriever query: %s", body)
         result = self.client.search(index=index, body=body)["hits"]["hits"]
 
         documents = [self._convert_es_hit_to_document(hit, return_embedding=self.return_embedding) for hit in result]
@@ -788,22 +790,11 @@ class ElasticsearchDocumentStore(BaseDocumentStore):
                     )
                 body["query"]["script_score"]["query"] = {"bool": {"filter": filter_clause}}
 
-            excluded_meta_data: Optional[list] = None
-
-            if self.excluded_meta_data:
-                excluded_meta_data = deepcopy(self.excluded_meta_data)
-
-                if return_embedding is True and self.embedding_field in excluded_meta_data:
-                    excluded_meta_data.remove(self.embedding_field)
-                elif return_embedding is False and self.embedding_field not in excluded_meta_data:
-                    excluded_meta_data.append(self.embedding_field)
-            elif return_embedding is False:
-                excluded_meta_data = [self.embedding_field]
-
+            excluded_meta_data = self._get_excluded_fields(return_embedding=return_embedding)
             if excluded_meta_data:
                 body["_source"] = {"excludes": excluded_meta_data}
 
-            logger.debug(f"Retriever query: {body}")
+            logger.debug("Retriever query: %s", body)
             try:
                 result = self.client.search(index=index, body=body, request_timeout=300)["hits"]["hits"]
             except RequestError as e:
@@ -846,6 +837,25 @@ class ElasticsearchDocumentStore(BaseDocumentStore):
         }
         return query
 
+    def _get_excluded_fields(self, return_embedding: bool) -> Optional[list]:
+        """
+        Fields to exclude from the `_source` of search hits: the `excluded_meta_data` plus the embedding field,
+        unless the embeddings are returned.
+        """
+        excluded_meta_data: Optional[list] = None
+
+        if self.excluded_meta_data:
+            excluded_meta_data = deepcopy(self.excluded_meta_data)
+
+            if return_embedding is True and self.embedding_field in excluded_meta_data:
+                excluded_meta_data.remove(self.embedding_field)
+            elif return_embedding is False and self.embedding_field not in excluded_meta_data:
+                excluded_meta_data.append(self.embedding_field)
+        elif return_embedding is False:
+            excluded_meta_data = [self.embedding_field]
+
+        return excluded_meta_data
+
     def _convert_es_hit_to_document(
             self,
             hit: dict,
@@ -1099,22 +1109,11 @@ class OpenSearchDocumentStore(ElasticsearchDocumentStore):
                     )
                 body["query"]["bool"]["filter"] = filter_clause         # type: ignore
 
-            excluded_meta_data: Optional[list] = None
-
-            if self.excluded_meta_data:
-                excluded_meta_data = deepcopy(self.excluded_meta_data)
-
-                if return_embedding is True and self.embedding_field in excluded_meta_data:
-                    excluded_meta_data.remove(self.embedding_field)
-                elif return_embedding is False and self.embedding_field not in excluded_meta_data:
-                    excluded_meta_data.append(self.embedding_field)
-            elif return_embedding is False:
-                excluded_meta_data = [self.embedding_field]
-
+            excluded_meta_data = self._get_excluded_fields(return_embedding=return_embedding)
             if excluded_meta_data:
                 body["_source"] = {"excludes": excluded_meta_data}
 
-            logger.debug(f"Retriever query: {body}")
+            logger.debug("Retriever query: %s", body)
             result = self.client.search(index=index, body=body, request_timeout=300)["hits"]["hits"]
 
             documents = [
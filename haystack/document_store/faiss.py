@@ -182,7 +182,7 @@ class FAISSDocumentStore(SQLDocumentStore):
             )
 
         field_map = self._create_document_field_map()
-        document_objects = [Document.from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in documents]
+        document_objects = Document.from_dicts(documents, field_map=field_map)
         document_objects = self._handle_duplicate_documents(documents=document_objects,
                                                             index=index,
                                                             duplicate_documents=duplicate_documents)
@@ -380,7 +380,7 @@ class FAISSDocumentStore(SQLDocumentStore):
         if embeddings and documents:
             raise ValueError("Either pass `documents` or `embeddings`. You passed both.")
         if documents:
-            document_objects = [Document.from_dict(d) if isinstance(d, dict) else d for d in documents]
+            document_objects = Document.from_dicts(documents)
             doc_embeddings = [doc.embedding for doc in document_objects]
             embeddings_for_train = np.array(doc_embeddings, dtype="float32")
             self.faiss_indexes[index].train(embeddings_for_train)
@@ -491,8 +491,16 @@ class FAISSDocumentStore(SQLDocumentStore):
         with open(config_path, 'w') as ipp:
             json.dump(self.pipeline_config["params"], ipp)
 
+    @staticmethod
+    def _is_ivf_index(faiss_index) -> bool:
+        try:
+            faiss.extract_index_ivf(faiss_index)
+        except RuntimeError:
+            return False
+        return True
+
     @classmethod
-    def load(cls, index_path: Union[str, Path], config_path: Optional[Union[str, Path]] = None):
+    def load(cls, index_path: Union[str, Path], config_path: Optional[Union[str, Path]] = None, mmap: bool = False):
         """
         Load a saved FAISS index from a file and connect to the SQL database.
         Note: In order to have a correct mapping from FAISS to SQL,
@@ -501,6 +509,10 @@ class FAISSDocumentStore(SQLDocumentStore):
         :param index_path: Stored FAISS index file. Can be created via calling `save()`
         :param config_path: Stored FAISS initial configuration parameters. 
             Can be created via calling `save()`
+        :param mmap: Memory-map the inverted lists of an IVF index (e.g. "IVF100,Flat") instead of reading them into
+            RAM. The vectors are then only paged in when a query touches them. No documents with embeddings can be
+            added to such an index. Other index types (e.g. "Flat", "HNSW") don't support memory-mapping and are
+            read into RAM completely, a warning is logged in this case.
         :param sql_url: Connection string to the SQL database that contains your docs and metadata.
             Overrides the value defined in the `faiss_init_params_path` file, if present
         :param index: Index name to load the FAISS index as. It must match the index name used for
@@ -521,7 +533,11 @@ class FAISSDocumentStore(SQLDocumentStore):
                              "Make sure the file exists and the you have the correct permissions "
                              "to access it.") from e
 
-        faiss_index = faiss.read_index(str(index_path))
+        io_flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if mmap else 0
+        faiss_index = faiss.read_index(str(index_path), io_flags)
+        if mmap and not cls._is_ivf_index(faiss_index):
+            logger.warning(f"Memory-mapping is only supported for IVF indexes. The {type(faiss_index).__name__} "
+                           f"loaded from `{index_path}` was read into RAM completely.")
 
         # Add other init params to override the ones defined in the init params file
         init_params["faiss_index"] = faiss_index
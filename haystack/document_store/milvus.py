@@ -198,7 +198,7 @@ class MilvusDocumentStore(SQLDocumentStore):
             logger.warning("Calling DocumentStore.write_documents() with empty list")
             return
 
-        document_objects = [Document.from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in documents]
+        document_objects = Document.from_dicts(documents, field_map=field_map)
         document_objects = self._handle_duplicate_documents(documents=document_objects,
                                                             index=index,
                                                             duplicate_documents=duplicate_documents)
@@ -322,7 +322,7 @@ class SQLDocumentStore(BaseDocumentStore):
             return
         # Make sure we comply to Document class format
         if isinstance(documents[0], dict):
-            document_objects = [Document.from_dict(d) if isinstance(d, dict) else d for d in documents]
+            document_objects = Document.from_dicts(documents)
         else:
             document_objects = documents
 
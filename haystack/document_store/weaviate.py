@@ -345,7 +345,7 @@ class WeaviateDocumentStore(BaseDocumentStore):
         # Get and cache current properties in the schema
         current_properties = self._get_current_properties(index)
 
-        document_objects = [Document.from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in documents]
+        document_objects = Document.from_dicts(documents, field_map=field_map)
         document_objects = self._handle_duplicate_documents(documents=document_objects,
                                                             index=index,
                                                             duplicate_documents=duplicate_documents)
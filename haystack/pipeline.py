@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import List, Optional, Dict, Union, Any
 import pickle
 import urllib
-from functools import wraps
+from functools import lru_cache, wraps
 
 try:
     from ray import serve
@@ -22,6 +22,7 @@ except:
 from transformers import AutoTokenizer, AutoModelForSequenceClassification, TextClassificationPipeline
 
 import networkx as nx
+import numpy as np
 import yaml
 from networkx import DiGraph
 from networkx.drawing.nx_agraph import to_agraph
@@ -39,6 +40,23 @@ from haystack.question_generator import QuestionGenerator
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> dict:
+    # mtime_ns and size are only part of the cache key, so a changed file is parsed again
+    with open(path, "r", encoding="utf-8") as stream:
+        return yaml.safe_load(stream)
+
+
+def _load_yaml(path: Path) -> dict:
+    """
+    Parse a YAML file. The result is cached in memory per path, modification time and size, so loading several
+    pipelines (or loading one pipeline repeatedly) from the same file parses it only once.
+    Returns a copy that the caller is free to modify.
+    """
+    stat = os.stat(path)
+    return copy.deepcopy(_parse_yaml(os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+
+
 class BasePipeline:
 
     def run(self, **kwargs):
@@ -110,8 +128,7 @@ class BasePipeline:
         :param path: Path of Pipeline YAML file.
         :param pipeline_name: name of the Pipeline.
         """
-        with open(path, "r", encoding='utf-8') as stream:
-            data = yaml.safe_load(stream)
+        data = _load_yaml(path)
 
         if pipeline_name is None:
             if len(data["pipelines"]) == 1:
@@ -138,8 +155,7 @@ class BasePipeline:
                                              variable 'MYDOCSTORE_PARAMS_INDEX=documents-2021' can be set. Note that an
                                              `_` sign must be used to specify nested hierarchical properties.
         """
-        with open(path, "r", encoding="utf-8") as stream:
-            data = yaml.safe_load(stream)
+        data = _load_yaml(path)
 
         pipeline_config = cls._get_pipeline_config_from_yaml(path=path, pipeline_name=pipeline_name)
 
@@ -182,6 +198,9 @@ class Pipeline(BasePipeline):
         self.graph = DiGraph()
         self.root_node = None
         self.components: dict = {}
+        # graph lookups done in every run(), filled lazily and reset whenever a node is added
+        self._ancestors: Dict[str, set] = {}  # node_id -> ancestors in the graph
+        self._successors: Dict[str, Dict[str, List[str]]] = {}  # node_id -> edge label -> next nodes
 
     def add_node(self, component, name: str, inputs: List[str]):
         """
@@ -198,6 +217,7 @@ class Pipeline(BasePipeline):
                        In cases when the predecessor node has multiple outputs, e.g., a "QueryClassifier", the output
                        must be specified explicitly as "QueryClassifier.output_2".
         """
+        self._reset_graph_caches()
         if self.root_node is None:
             root_node = inputs[0]
             if root_node in ["Query", "File"]:
@@ -315,10 +335,10 @@ class Pipeline(BasePipeline):
                 if debug_logs is not None:
                     node_input["params"][node_id]["debug_logs"] = debug_logs
 
-            predecessors = set(nx.ancestors(self.graph, node_id))
-            if predecessors.isdisjoint(set(queue.keys())):  # only execute if predecessor nodes are executed
+            predecessors = self._get_ancestors(node_id)
+            if predecessors.isdisjoint(queue):  # only execute if predecessor nodes are executed
                 try:
-                    logger.debug(f"Running node `{node_id}` with input `{node_input}`")
+                    logger.debug("Running node `%s` with input `%s`", node_id, node_input)
                     node_output, stream_id = self.graph.nodes[node_id]["component"]._dispatch_run(**node_input)
                 except Exception as e:
                     tb = traceback.format_exc()
@@ -351,14 +371,29 @@ class Pipeline(BasePipeline):
                 i += 1  # attempt executing next node in the queue as current `node_id` has unprocessed predecessors
         return node_output
 
+    def _get_ancestors(self, node_id: str) -> set:
+        """
+        Return all nodes from which `node_id` can be reached. The graph only changes in `add_node()`, so they are
+        computed once per node and reused in every `run()`.
+        """
+        ancestors = self._ancestors.get(node_id)
+        if ancestors is None:
+            ancestors = self._ancestors[node_id] = set(nx.ancestors(self.graph, node_id))
+        return ancestors
+
     def get_next_nodes(self, node_id: str, stream_id: str):
-        current_node_edges = self.graph.edges(node_id, data=True)
-        next_nodes = [
-            next_node
-            for _, next_node, data in current_node_edges
-            if not stream_id or data["label"] == stream_id or stream_id == "output_all"
-        ]
-        return next_nodes
+        successors = self._successors.get(node_id)
+        if successors is None:
+            successors = {"output_all": []}
+            for _, next_node, data in self.graph.edges(node_id, data=True):
+                successors["output_all"].append(next_node)
+                successors.setdefault(data["label"], []).append(next_node)
+            self._successors[node_id] = successors
+        return list(successors.get(stream_id or "output_all", []))
+
+    def _reset_graph_caches(self):
+        self._ancestors = {}
+        self._successors = {}
 
     def get_nodes_by_class(self, class_type) -> List[Any]:
         """
@@ -593,6 +628,15 @@ class BaseStandardPipeline(ABC):
         """
         self.pipeline.draw(path)
 
+    def _retrieve_batch(self, queries: List[str], params: Optional[dict] = None) -> List[List[Document]]:
+        """
+        Call `retrieve_batch()` of the "Retriever" node with the retriever params given in the same format as for `run()`.
+        """
+        params = params or {}
+        retriever_params = {key: params[key] for key in ("filters", "top_k", "index") if key in params}
+        retriever_params.update(params.get("Retriever", {}))
+        return self.pipeline.get_node("Retriever").retrieve_batch(queries=queries, **retriever_params)
+
 
 class ExtractiveQAPipeline(BaseStandardPipeline):
     def __init__(self, reader: BaseReader, retriever: BaseRetriever):
@@ -656,6 +700,17 @@ class DocumentSearchPipeline(BaseStandardPipeline):
         output = self.pipeline.run(query=query, params=params, debug=debug, debug_logs=debug_logs)
         return output
 
+    def run_batch(self, queries: List[str], params: Optional[dict] = None) -> List[dict]:
+        """
+        Run the search for several queries at once. Dense retrievers embed all queries in a single forward pass.
+
+        :param queries: the query strings.
+        :param params: params for the `retriever`. For instance, params={"Retriever": {"top_k": 10}}
+        :return: one output per query in the format of `run()`, i.e. {"query": ..., "documents": [...]}
+        """
+        documents_per_query = self._retrieve_batch(queries=queries, params=params)
+        return [{"query": query, "documents": documents} for query, documents in zip(queries, documents_per_query)]
+
 
 class GenerativeQAPipeline(BaseStandardPipeline):
     def __init__(self, generator: BaseGenerator, retriever: BaseRetriever):
@@ -777,6 +832,19 @@ class FAQPipeline(BaseStandardPipeline):
         output = self.pipeline.run(query=query, params=params, debug=debug, debug_logs=debug_logs)
         return output
 
+    def run_batch(self, queries: List[str], params: Optional[dict] = None) -> List[dict]:
+        """
+        Find similar FAQs for several queries at once. Dense retrievers embed all queries in a single forward pass.
+
+        :param queries: the query strings.
+        :param params: params for the `retriever`. For instance, params={"Retriever": {"top_k": 10}}
+        :return: one output per query in the format of `run()`, i.e. {"query": ..., "answers": [...]}
+        """
+        documents_per_query = self._retrieve_batch(queries=queries, params=params)
+        docs2answers = self.pipeline.get_node("Docs2Answers")
+        return [docs2answers.run(query=query, documents=documents)[0]
+                for query, documents in zip(queries, documents_per_query)]
+
 
 class TranslationWrapperPipeline(BaseStandardPipeline):
 
@@ -908,6 +976,20 @@ class RootNode(BaseComponent):
         return {}, "output_1"
 
 
+# The query classifier models are only used for inference, so all instances using the same model share one copy
+# instead of downloading / loading it again, e.g. when a pipeline is created several times.
+@lru_cache(maxsize=8)
+def _load_pickle(url: str):
+    return pickle.load(urllib.request.urlopen(url))
+
+
+@lru_cache(maxsize=8)
+def _load_text_classification_pipeline(model_name_or_path: str) -> TextClassificationPipeline:
+    model = AutoModelForSequenceClassification.from_pretrained(model_name_or_path)
+    tokenizer = AutoTokenizer.from_pretrained(model_name_or_path)
+    return TextClassificationPipeline(model=model, tokenizer=tokenizer)
+
+
 class SklearnQueryClassifier(BaseComponent):
     """
     A node to classify an incoming query into one of two categories using a lightweight sklearn model. Depending on the result, the query flows to a different branch in your pipeline
@@ -989,8 +1071,8 @@ class SklearnQueryClassifier(BaseComponent):
             file_url = urllib.request.pathname2url(r"{}".format(vectorizer_name_or_path))
             vectorizer_name_or_path = f"file:{file_url}"
 
-        self.model = pickle.load(urllib.request.urlopen(model_name_or_path))
-        self.vectorizer = pickle.load(urllib.request.urlopen(vectorizer_name_or_path))
+        self.model = _load_pickle(model_name_or_path)
+        self.vectorizer = _load_pickle(vectorizer_name_or_path)
 
 
     def run(self, query):
@@ -1057,12 +1139,7 @@ class TransformersQueryClassifier(BaseComponent):
         # save init parameters to enable export of component config as YAML
         self.set_config(model_name_or_path=model_name_or_path)
 
-        model = AutoModelForSequenceClassification.from_pretrained(model_name_or_path)
-        tokenizer = AutoTokenizer.from_pretrained(model_name_or_path)
-
-        self.query_classification_pipeline = TextClassificationPipeline(
-            model=model, tokenizer=tokenizer
-        )
+        self.query_classification_pipeline = _load_text_classification_pipeline(str(model_name_or_path))
 
     def run(self, query):
 
@@ -1118,29 +1195,58 @@ class JoinDocuments(BaseComponent):
             for input_from_node in inputs:
                 for doc in input_from_node["documents"]:
                     document_map[doc.id] = doc
+            documents = sorted(document_map.values(), key=lambda d: d.score, reverse=True)
+            if self.top_k_join:
+                documents = documents[: self.top_k_join]
         elif self.join_mode == "merge":
-            document_map = {}
-            if self.weights:
-                weights = self.weights
-            else:
-                weights = [1/len(inputs)] * len(inputs)
-            for input_from_node, weight in zip(inputs, weights):
-                for doc in input_from_node["documents"]:
-                    if document_map.get(doc.id):  # document already exists; update score
-                        document_map[doc.id].score += doc.score * weight
-                    else:  # add the document in map
-                        document_map[doc.id] = deepcopy(doc)
-                        document_map[doc.id].score *= weight
+            documents = self._merge(inputs)
         else:
             raise Exception(f"Invalid join_mode: {self.join_mode}")
 
-        documents = sorted(document_map.values(), key=lambda d: d.score, reverse=True)
-
-        if self.top_k_join:
-            documents = documents[: self.top_k_join]
         output = {"documents": documents, "labels": inputs[0].get("labels", None)}
         return output, "output_1"
 
+    def _merge(self, inputs: List[dict]) -> List[Document]:
+        """
+        Sum up the weighted scores of each document over all inputs and return the documents sorted by that score.
+        """
+        if self.weights is not None and len(self.weights) != len(inputs):
+            raise ValueError(f"JoinDocuments got {len(self.weights)} weights for {len(inputs)} inputs. "
+                             f"Provide one weight per input node.")
+        weights = np.array(self.weights or [1 / len(inputs)] * len(inputs), dtype=np.float64)
+
+        unique_docs: List[Document] = []
+        id_to_idx: Dict[str, int] = {}
+        for input_from_node in inputs:
+            for doc in input_from_node["documents"]:
+                if doc.id not in id_to_idx:
+                    id_to_idx[doc.id] = len(unique_docs)
+                    unique_docs.append(doc)
+
+        # one row of scores per input, one column per unique document
+        scores = np.zeros((len(inputs), len(unique_docs)), dtype=np.float64)
+        for row, input_from_node in enumerate(inputs):
+            docs = input_from_node["documents"]
+            idxs = np.fromiter((id_to_idx[doc.id] for doc in docs), dtype=np.int64, count=len(docs))
+            np.add.at(scores[row], idxs, np.fromiter((doc.score for doc in docs), dtype=np.float64, count=len(docs)))
+        combined = weights @ scores
+
+        top_k = self.top_k_join or len(unique_docs)
+        if top_k < len(unique_docs):
+            top_idxs = np.argpartition(-combined, top_k - 1)[:top_k]
+        else:
+            top_idxs = np.arange(len(unique_docs))
+        # sort by descending score, ties keep the order in which the documents first appeared
+        top_idxs = top_idxs[np.lexsort((top_idxs, -combined[top_idxs]))]
+
+        documents = []
+        for idx in top_idxs:
+            # shallow copy, so that the score of the input document isn't modified
+            doc = copy.copy(unique_docs[idx])
+            doc.score = float(combined[idx])
+            documents.append(doc)
+        return documents
+
 
 class RayPipeline(Pipeline):
     """
@@ -1346,6 +1452,7 @@ class RayPipeline(Pipeline):
                        In cases when the predecessor node has multiple outputs, e.g., a "QueryClassifier", the output
                        must be specified explicitly as "QueryClassifier.output_2".
         """
+        self._reset_graph_caches()
         self.graph.add_node(name, component=handle, inputs=inputs, outgoing_edges=outgoing_edges)
 
         if len(self.graph.nodes) == 2:  # first node added; connect with Root
@@ -34,8 +34,8 @@ class BaseRanker(BaseComponent):
         else:
             results = []
 
-        document_ids = [doc.id for doc in results]
-        logger.debug(f"Retrieved documents with IDs: {document_ids}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Retrieved documents with IDs: %s", [doc.id for doc in results])
         output = {"documents": results}
 
         return output, "output_1"
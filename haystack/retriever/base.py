@@ -33,6 +33,20 @@ class BaseRetriever(BaseComponent):
         """
         pass
 
+    def retrieve_batch(self, queries: List[str], filters: dict = None, top_k: Optional[int] = None,
+                       index: str = None) -> List[List[Document]]:
+        """
+        Retrieve documents for a list of queries. Retrievers that embed the queries override this method
+        to run a single forward pass for all queries.
+
+        :param queries: The queries
+        :param filters: A dictionary where the keys specify a metadata field and the value is a list of accepted values for that field
+        :param top_k: How many documents to return per query.
+        :param index: The name of the index in the DocumentStore from which to retrieve documents
+        :return: One list of documents per query
+        """
+        return [self.retrieve(query=query, filters=filters, top_k=top_k, index=index) for query in queries]
+
     def timing(self, fn, attr_name):
         """Wrapper method used to time functions. """
         @wraps(fn)
@@ -206,8 +220,8 @@ class BaseRetriever(BaseComponent):
         index: Optional[str] = None,
     ):
         documents = self.retrieve(query=query, filters=filters, top_k=top_k, index=index)
-        document_ids = [doc.id for doc in documents]
-        logger.debug(f"Retrieved documents with IDs: {document_ids}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Retrieved documents with IDs: %s", [doc.id for doc in documents])
         output = {"documents": documents}
 
         return output, "output_1"
@@ -55,7 +55,8 @@ class DensePassageRetriever(BaseRetriever):
                  similarity_function: str = "dot_product",
                  global_loss_buffer_size: int = 150000,
                  progress_bar: bool = True,
-                 devices: Optional[List[Union[int, str, torch.device]]] = None
+                 devices: Optional[List[Union[int, str, torch.device]]] = None,
+                 use_fp16: bool = False
                  ):
         """
         Init the Retriever incl. the two encoder models from a local or remote model checkpoint.
@@ -104,6 +105,9 @@ class DensePassageRetriever(BaseRetriever):
                              Can be helpful to disable in production deployments to keep the logs clean.
         :param devices: List of GPU devices to limit inference to certain GPUs and not use all available ones (e.g. ["cuda:0"]).
                         As multi-GPU training is currently not implemented for DPR, training will only use the first device provided in this list.
+        :param use_fp16: Whether to compute the embeddings in half precision (torch autocast) when running on GPU.
+                         Roughly doubles the inference throughput on recent GPUs. The embeddings are still returned
+                         as float32. Has no effect on CPU.
         """
 
         # save init parameters to enable export of component config as YAML
@@ -113,7 +117,7 @@ class DensePassageRetriever(BaseRetriever):
             model_version=model_version, max_seq_len_query=max_seq_len_query, max_seq_len_passage=max_seq_len_passage,
             top_k=top_k, use_gpu=use_gpu, batch_size=batch_size, embed_title=embed_title,
             use_fast_tokenizers=use_fast_tokenizers, infer_tokenizer_classes=infer_tokenizer_classes,
-            similarity_function=similarity_function, progress_bar=progress_bar, devices=devices
+            similarity_function=similarity_function, progress_bar=progress_bar, devices=devices, use_fp16=use_fp16
         )
 
         if devices is not None:
@@ -130,6 +134,7 @@ class DensePassageRetriever(BaseRetriever):
         self.batch_size = batch_size
         self.progress_bar = progress_bar
         self.top_k = top_k
+        self.use_fp16 = use_fp16
 
         if document_store is None:
            logger.warning("DensePassageRetriever initialized without a document store. "
@@ -213,6 +218,28 @@ class DensePassageRetriever(BaseRetriever):
         documents = self.document_store.query_by_embedding(query_emb=query_emb[0], top_k=top_k, filters=filters, index=index)
         return documents
 
+    def retrieve_batch(self, queries: List[str], filters: dict = None, top_k: Optional[int] = None,
+                       index: str = None) -> List[List[Document]]:
+        """
+        Retrieve documents for a list of queries. All queries are embedded in one pass of the query encoder.
+
+        :param queries: The queries
+        :param filters: A dictionary where the keys specify a metadata field and the value is a list of accepted values for that field
+        :param top_k: How many documents to return per query.
+        :param index: The name of the index in the DocumentStore from which to retrieve documents
+        :return: One list of documents per query
+        """
+        if top_k is None:
+            top_k = self.top_k
+        if not self.document_store:
+            logger.error("Cannot perform retrieve_batch() since DensePassageRetriever initialized with document_store=None")
+            return [[] for _ in queries]
+        if index is None:
+            index = self.document_store.index
+        query_embs = self.embed_queries(texts=queries)
+        return [self.document_store.query_by_embedding(query_emb=query_emb, top_k=top_k, filters=filters, index=index)
+                for query_emb in query_embs]
+
     def _get_predictions(self, dicts):
         """
         Feed a preprocessed dataset to the model and get the actual predictions (forward pass + formatting).
@@ -247,18 +274,21 @@ class DensePassageRetriever(BaseRetriever):
         else:
             disable_tqdm = not self.progress_bar
 
+        use_autocast = self.use_fp16 and torch.device(self.devices[0]).type == "cuda"
+
         with tqdm(total=len(data_loader)*self.batch_size, unit=" Docs", desc=f"Create embeddings", position=1,
                   leave=False, disable=disable_tqdm) as progress_bar:
             for batch in data_loader:
                 batch = {key: batch[key].to(self.devices[0]) for key in batch}
 
                 # get logits
-                with torch.no_grad():
+                with torch.no_grad(), torch.cuda.amp.autocast(enabled=use_autocast):
                     query_embeddings, passage_embeddings = self.model.forward(**batch)[0]
+                    # cast back to float32 in case of autocast, as the document stores expect float32 embeddings
                     if query_embeddings is not None:
-                        all_embeddings["query"].append(query_embeddings.cpu().numpy())
+                        all_embeddings["query"].append(query_embeddings.float().cpu().numpy())
                     if passage_embeddings is not None:
-                        all_embeddings["passages"].append(passage_embeddings.cpu().numpy())
+                        all_embeddings["passages"].append(passage_embeddings.float().cpu().numpy())
                 progress_bar.update(self.batch_size)
 
         if all_embeddings["passages"]:
@@ -542,6 +572,28 @@ class EmbeddingRetriever(BaseRetriever):
                                                            top_k=top_k, index=index)
         return documents
 
+    def retrieve_batch(self, queries: List[str], filters: dict = None, top_k: Optional[int] = None,
+                       index: str = None) -> List[List[Document]]:
+        """
+        Retrieve documents for a list of queries. All queries are embedded in one pass of the embedding model.
+
+        :param queries: The queries
+        :param filters: A dictionary where the keys specify a metadata field and the value is a list of accepted values for that field
+        :param top_k: How many documents to return per query.
+        :param index: The name of the index in the DocumentStore from which to retrieve documents
+        :return: One list of documents per query
+        """
+        if top_k is None:
+            top_k = self.top_k
+        if not self.document_store:
+            logger.error("Cannot perform retrieve_batch() since EmbeddingRetriever initialized with document_store=None")
+            return [[] for _ in queries]
+        if index is None:
+            index = self.document_store.index
+        query_embs = self.embed_queries(texts=queries)
+        return [self.document_store.query_by_embedding(query_emb=query_emb, filters=filters, top_k=top_k, index=index)
+                for query_emb in query_embs]
+
     def embed_queries(self, texts: List[str]) -> List[np.ndarray]:
         """
         Create embeddings for a list of queries.
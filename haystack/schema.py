@@ -37,6 +37,9 @@ from pydantic import BaseConfig
 BaseConfig.arbitrary_types_allowed = True
 
 
+_DOCUMENT_INIT_ARGS = frozenset(["content", "content_type", "id", "score", "question", "meta", "embedding"])
+
+
 @dataclass
 class Document:
     content: Union[str, pd.DataFrame]
@@ -145,17 +148,16 @@ class Document:
         """
 
         _doc = dict.copy()
-        init_args = ["content", "content_type", "id", "score", "question", "meta", "embedding"]
         if "meta" not in _doc.keys():
             _doc["meta"] = {}
         # copy additional fields into "meta"
         for k, v in _doc.items():
-            if k not in init_args and k not in field_map:
+            if k not in _DOCUMENT_INIT_ARGS and k not in field_map:
                 _doc["meta"][k] = v
         # remove additional fields from top level
         _new_doc = {}
         for k, v in _doc.items():
-            if k in init_args:
+            if k in _DOCUMENT_INIT_ARGS:
                 _new_doc[k] = v
             elif k in field_map:
                 k = field_map[k]
@@ -163,6 +165,19 @@ class Document:
 
         return cls(**_new_doc)
 
+    @classmethod
+    def from_dicts(cls, documents: List[Union[dict, "Document"]], field_map={}) -> List["Document"]:
+        """
+        Convert a batch of dicts to Documents via `from_dict()`. Items that already are Documents are passed through
+        unchanged, so DocumentStores can call this on any input of `write_documents()`.
+
+        :param documents: List of dicts and / or Documents
+        :param field_map: Dict with keys being the custom target keys and values being the standard Document attributes
+        :return: List of Documents
+        """
+        from_dict = cls.from_dict
+        return [from_dict(d, field_map=field_map) if isinstance(d, dict) else d for d in documents]
+
     def to_json(self, field_map={}) -> str:
         d = self.to_dict(field_map=field_map)
         j = json.dumps(d, cls=NumpyEncoder)
@@ -581,6 +596,30 @@ def record_debug_logs(func: Callable, node_name: str, logs: bool) -> Callable:
     return inner
 
 
+def _collect_embeddings(value, memo: dict):
+    if isinstance(value, Document):
+        if value.embedding is not None:
+            memo[id(value.embedding)] = value.embedding
+    elif isinstance(value, dict):
+        for v in value.values():
+            _collect_embeddings(v, memo)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            _collect_embeddings(v, memo)
+
+
+def _copy_node_inputs(kwargs: dict) -> dict:
+    """
+    Deep copy the inputs (or debug outputs) of a node, so that nodes modifying their input (e.g. translators, entity extractors or
+    classifiers writing to `content` / `meta` of documents) don't change the inputs of the caller, of sibling
+    branches or the `_debug` output of preceding nodes.
+    Embeddings are shared between the original and the copied documents instead of copying them at every node.
+    """
+    memo: dict = {}
+    _collect_embeddings(kwargs, memo)
+    return deepcopy(kwargs, memo)
+
+
 class BaseComponent:
     """
     A base class for implementing nodes in a Pipeline.
@@ -703,7 +742,7 @@ class BaseComponent:
           - collate `_debug` information if present
           - merge component output with the preceding output and pass it on to the subsequent Component in the Pipeline
         """
-        arguments = deepcopy(kwargs)
+        arguments = _copy_node_inputs(kwargs)
         params = arguments.get("params") or {}
 
         run_signature_args = inspect.signature(self.run).parameters.keys()
@@ -732,18 +771,22 @@ class BaseComponent:
             if key in run_signature_args:
                 run_inputs[key] = value
 
+        # snapshot the debug input before run() gets the chance to modify it
+        debug_input = _copy_node_inputs({**run_inputs, **run_params}) if self.debug else None
+
         output, stream = self.run(**run_inputs, **run_params)
 
         # Collect debug information
         current_debug = output.get("_debug", {})
         if self.debug:
-            current_debug["input"] = {**run_inputs, **run_params}
+            current_debug["input"] = debug_input
             if self.debug:
                 current_debug["input"]["debug"] = self.debug
             if self.debug_logs:
                 current_debug["input"]["debug_logs"] = self.debug_logs
             filtered_output = {key: value for key, value in output.items() if key != "_debug"} # Exclude _debug to avoid recursion
-            current_debug["output"] = filtered_output
+            # copy, so that subsequent nodes modifying these outputs don't change the debug output
+            current_debug["output"] = _copy_node_inputs(filtered_output)
 
         # append _debug information from nodes
         all_debug = arguments.get("_debug", {})
@@ -4,9 +4,6 @@
 # - the SQuAD 2.0 Dataset (https://rajpurkar.github.io/SQuAD-explorer/) from  Rajpurkar et al.
 #   licensed under  CC BY-SA 4.0 (https://creativecommons.org/licenses/by-sa/4.0/legalcode)
 
-from retriever import benchmark_indexing, benchmark_querying
-from reader import benchmark_reader
-from utils import load_config
 import argparse
 
 
@@ -24,15 +21,27 @@ parser.add_argument('--update_json', default=False, action="store_true",
                     help='Update the json file with the results of this run so that the website can be updated')
 parser.add_argument('--save_markdown', default=False, action="store_true",
                     help='Update the json file with the results of this run so that the website can be updated')
-args = parser.parse_args()
 
-# load config
-params, filenames = load_config(config_filename="config.json", ci=args.ci)
 
-if args.retriever_index:
-    benchmark_indexing(**params, **filenames, ci=args.ci, update_json=args.update_json, save_markdown=args.save_markdown)
-if args.retriever_query:
-    benchmark_querying(**params, **filenames, ci=args.ci, update_json=args.update_json, save_markdown=args.save_markdown)
-if args.reader:
-    benchmark_reader(**params, **filenames, ci=args.ci, update_json=args.update_json, save_markdown=args.save_markdown)
+def main():
+    args = parser.parse_args()
 
+    # import the benchmarks (and with them haystack) only after parsing, so that `--help` returns immediately
+    from retriever import benchmark_indexing, benchmark_querying
+    from reader import benchmark_reader
+    from utils import load_config
+
+    # the config only holds retriever parameters, so skip loading it for reader-only runs
+    if args.retriever_index or args.retriever_query:
+        params, filenames = load_config(config_filename="config.json", ci=args.ci)
+
+    if args.retriever_index:
+        benchmark_indexing(**params, **filenames, ci=args.ci, update_json=args.update_json, save_markdown=args.save_markdown)
+    if args.retriever_query:
+        benchmark_querying(**params, **filenames, ci=args.ci, update_json=args.update_json, save_markdown=args.save_markdown)
+    if args.reader:
+        benchmark_reader(ci=args.ci, update_json=args.update_json, save_markdown=args.save_markdown)
+
+
+if __name__ == "__main__":
+    main()
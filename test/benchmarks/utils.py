@@ -15,6 +15,8 @@ import logging
 import subprocess
 import time
 import json
+from copy import deepcopy
+from functools import lru_cache
 from typing import Union
 from pathlib import Path
 logger = logging.getLogger(__name__)
@@ -129,8 +131,15 @@ def index_to_doc_store(doc_store, docs, retriever, labels=None):
     if callable(getattr(retriever, "embed_passages", None)) and docs[0].embedding is None:
         doc_store.update_embeddings(retriever, index=doc_index)
 
+@lru_cache(maxsize=None)
+def _read_config(config_filename):
+    with open(config_filename) as f:
+        return json.load(f)
+
+
 def load_config(config_filename, ci):
-    conf = json.load(open(config_filename))
+    # copy, since the filenames get narrowed down below and the parsed config is shared between calls
+    conf = deepcopy(_read_config(config_filename))
     if ci:
         params = conf["params"]["ci"]
     else:
@@ -1,8 +1,11 @@
+import copy
 import subprocess
 import time
+from functools import lru_cache
 from subprocess import run
 from sys import platform
 
+import numpy as np
 import psutil
 import pytest
 import requests
@@ -121,6 +124,13 @@ def pytest_collection_modifyitems(config,items):
                     reason=f'{cur_doc_store} is disabled. Enable via pytest --document_store_type="{cur_doc_store}"')
                 item.add_marker(skip_docstore)
 
+        # when running in parallel (pytest -n auto --dist loadgroup), all tests of a document store backed by a
+        # shared server run on the same worker, as they write to the same fixed index names
+        for server_doc_store in ["elasticsearch", "milvus", "weaviate"]:
+            if server_doc_store in keywords:
+                item.add_marker(pytest.mark.xdist_group(name=server_doc_store))
+                break
+
 
 @pytest.fixture(scope="session")
 def elasticsearch_fixture():
@@ -144,6 +154,20 @@ def elasticsearch_fixture():
         time.sleep(30)
 
 
+@lru_cache(maxsize=None)
+def get_es_client() -> Elasticsearch:
+    """
+    Elasticsearch client shared by all tests that maintain test indices directly, so that its connection pool is
+    reused instead of being set up for every test.
+    """
+    return Elasticsearch()
+
+
+@pytest.fixture(scope="session")
+def es_client(elasticsearch_fixture):
+    return get_es_client()
+
+
 @pytest.fixture(scope="session")
 def milvus_fixture():
     # test if a Milvus server is already running. If not, start Milvus docker container locally.
@@ -304,6 +328,15 @@ def test_docs_xs():
     ]
 
 
+@pytest.fixture(scope="session")
+def embedding_pool():
+    """
+    Pool of random 768-d float32 embeddings generated once per session. Tests take rows from it instead of
+    sampling new vectors for every document.
+    """
+    return np.random.default_rng(0).random((32, 768), dtype=np.float32)
+
+
 @pytest.fixture(scope="module")
 def reader_without_normalized_scores():
     return FARMReader(
@@ -315,7 +348,7 @@ def reader_without_normalized_scores():
     )
 
 
-@pytest.fixture(params=["farm", "transformers"], scope="module")
+@pytest.fixture(params=["farm", "transformers"], scope="session")
 def reader(request):
     if request.param == "farm":
         return FARMReader(
@@ -361,6 +394,18 @@ def zero_shot_document_classifier():
     )
 
 
+@lru_cache(maxsize=None)
+def _load_farm_reader(model_name_or_path):
+    return FARMReader(model_name_or_path=model_name_or_path)
+
+
+@pytest.fixture
+def roberta_reader():
+    # the weights are loaded once per session, but Pipeline.run() sets debug flags on the node instance,
+    # so every test gets its own shallow copy
+    return copy.copy(_load_farm_reader("deepset/roberta-base-squad2"))
+
+
 # TODO Fix bug in test_no_answer_output when using
 # @pytest.fixture(params=["farm", "transformers"])
 @pytest.fixture(params=["farm"], scope="module")
@@ -385,14 +430,14 @@ def no_answer_reader(request):
 
 @pytest.fixture(scope="module")
 def prediction(reader, test_docs_xs):
-    docs = [Document.from_dict(d) if isinstance(d, dict) else d for d in test_docs_xs]
+    docs = Document.from_dicts(test_docs_xs)
     prediction = reader.predict(query="Who lives in Berlin?", documents=docs, top_k=5)
     return prediction
 
 
 @pytest.fixture(scope="module")
 def no_answer_prediction(no_answer_reader, test_docs_xs):
-    docs = [Document.from_dict(d) if isinstance(d, dict) else d for d in test_docs_xs]
+    docs = Document.from_dicts(test_docs_xs)
     prediction = no_answer_reader.predict(query="What is the meaning of life?", documents=docs, top_k=5)
     return prediction
 
@@ -408,22 +453,38 @@ def retriever_with_docs(request, document_store_with_docs):
     return get_retriever(request.param, document_store_with_docs)
 
 
+@lru_cache(maxsize=None)
+def _load_retriever(retriever_type):
+    # Loading the encoder weights dominates the runtime of the dense retriever tests. The weights are only read
+    # by the tests, so load them once per session and attach the document store of each test to a shallow copy.
+    if retriever_type == "dpr":
+        return DensePassageRetriever(document_store=None,
+                                     query_embedding_model="facebook/dpr-question_encoder-single-nq-base",
+                                     passage_embedding_model="facebook/dpr-ctx_encoder-single-nq-base",
+                                     use_gpu=False, embed_title=True)
+    if retriever_type == "embedding":
+        # EmbeddingRetriever needs a document store at init, which gets replaced in _with_document_store()
+        return EmbeddingRetriever(document_store=InMemoryDocumentStore(),
+                                  embedding_model="deepset/sentence_bert",
+                                  use_gpu=False)
+    raise Exception(f"No cached retriever for '{retriever_type}'")
+
+
+def _with_document_store(retriever, document_store):
+    retriever = copy.copy(retriever)
+    retriever.document_store = document_store
+    retriever.pipeline_config = copy.deepcopy(retriever.pipeline_config)
+    retriever.pipeline_config["params"]["document_store"] = document_store.pipeline_config
+    return retriever
+
+
 def get_retriever(retriever_type, document_store):
 
-    if retriever_type == "dpr":
-        retriever = DensePassageRetriever(document_store=document_store,
-                                          query_embedding_model="facebook/dpr-question_encoder-single-nq-base",
-                                          passage_embedding_model="facebook/dpr-ctx_encoder-single-nq-base",
-                                          use_gpu=False, embed_title=True)
+    if retriever_type in ("dpr", "embedding"):
+        retriever = _with_document_store(_load_retriever(retriever_type), document_store)
     elif retriever_type == "tfidf":
         retriever = TfidfRetriever(document_store=document_store)
         retriever.fit()
-    elif retriever_type == "embedding":
-        retriever = EmbeddingRetriever(
-            document_store=document_store,
-            embedding_model="deepset/sentence_bert",
-            use_gpu=False
-        )
     elif retriever_type == "retribert":
         retriever = EmbeddingRetriever(document_store=document_store,
                                        embedding_model="yjernite/retribert-base-uncased",
@@ -444,16 +505,16 @@ def get_retriever(retriever_type, document_store):
 def document_store_with_docs(request, test_docs_xs):
     document_store = get_document_store(request.param)
     document_store.write_documents(test_docs_xs)
-    yield document_store
-    document_store.delete_documents()
+    return document_store
 
 
+# No cleanup after the tests is needed: get_document_store() either wipes the test indices of server-based stores
+# before creating a store or returns a store backed by in-memory SQLite
 @pytest.fixture
 def document_store(request, test_docs_xs):
     vector_dim = request.node.get_closest_marker("vector_dim", pytest.mark.vector_dim(768))
     document_store = get_document_store(request.param, vector_dim.args[0])
-    yield document_store
-    document_store.delete_documents()
+    return document_store
 
 
 def get_document_store(document_store_type, embedding_dim=768, embedding_field="embedding"):
@@ -465,8 +526,7 @@ def get_document_store(document_store_type, embedding_dim=768, embedding_field="
         )
     elif document_store_type == "elasticsearch":
         # make sure we start from a fresh index
-        client = Elasticsearch()
-        client.indices.delete(index='haystack_test*', ignore=[404])
+        get_es_client().indices.delete(index='haystack_test*', ignore=[404])
         document_store = ElasticsearchDocumentStore(
             index="haystack_test", return_embedding=True, embedding_dim=embedding_dim, embedding_field=embedding_field
         )
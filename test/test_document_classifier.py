@@ -1,4 +1,10 @@
+import copy
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import torch
 
 from haystack import Document
 from haystack.document_classifier.base import BaseDocumentClassifier
@@ -25,6 +31,27 @@ def test_document_classifier(document_classifier):
     for i, doc in enumerate(results):
         assert doc.to_dict()["meta"]["classification"]["label"] == expected_labels[i]
 
+    predictions = document_classifier.predict_batch(texts=[doc.content for doc in docs])
+    assert [prediction["label"] for prediction in predictions] == expected_labels
+
+
+@pytest.mark.slow
+def test_document_classifier_quantize(document_classifier, monkeypatch):
+    # quantize a copy, the fixture is shared with other tests
+    classifier = copy.deepcopy(document_classifier)
+    docs = [Document(content="That's good. I like it.", id="1"), Document(content="That's bad. I don't like it.", id="2")]
+    classifier.run(query="", documents=docs)
+    assert len(classifier._cache) == 2
+
+    classifier.quantize()
+    assert len(classifier._cache) == 0
+    output, _ = classifier.run(query="", documents=[Document(content=doc.content, id=doc.id) for doc in docs])
+    assert all("classification" in doc.meta for doc in output["documents"])
+
+    monkeypatch.setattr(classifier.model, "device", torch.device("cuda"))
+    with pytest.raises(ValueError):
+        classifier.quantize()
+
 
 @pytest.mark.slow
 def test_zero_shot_document_classifier(zero_shot_document_classifier):
@@ -46,3 +73,145 @@ def test_zero_shot_document_classifier(zero_shot_document_classifier):
     expected_labels = ["positive", "negative"]
     for i, doc in enumerate(results):
         assert doc.to_dict()["meta"]["classification"]["label"] == expected_labels[i]
+
+    # partial cache hit, only a single document is passed to predict()
+    output, _ = zero_shot_document_classifier.run(
+        query="", documents=[Document(content=docs[0].content, id="1"), Document(content=docs[1].content, id="3")]
+    )
+    assert [doc.meta["classification"]["label"] for doc in output["documents"]] == expected_labels
+
+    predictions = zero_shot_document_classifier.predict_batch(texts=[docs[1].content])
+    assert len(predictions) == 1
+    assert predictions[0]["label"] == "negative"
+
+
+class MockDocumentClassifier(BaseDocumentClassifier):
+    def __init__(self):
+        super().__init__()
+        self.predict_calls = 0
+
+    def predict(self, documents):
+        self.predict_calls += 1
+        for doc in documents:
+            doc.meta["classification"] = {"label": doc.content}
+        return documents
+
+
+def test_document_classifier_micro_batching():
+    classifier = MockDocumentClassifier()
+    # the batch is only run early once it's full, i.e. once both threads enqueued their documents
+    classifier.max_latency_ms = 60_000
+    classifier.max_batch = 4
+    barrier = threading.Barrier(2)
+
+    def classify(i):
+        docs = [Document(content=f"{i}-{j}", id=f"{i}-{j}") for j in range(2)]
+        barrier.wait()
+        output, _ = classifier.run(query="", documents=docs)
+        return output["documents"]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(classify, range(2)))
+
+    for i, docs in enumerate(results):
+        assert [doc.meta["classification"]["label"] for doc in docs] == [f"{i}-0", f"{i}-1"]
+    assert classifier.predict_calls == 1
+    assert classifier.query_count == 2
+
+
+def test_document_classifier_copy():
+    classifier = MockDocumentClassifier()
+    classifier.run(query="", documents=[Document(content="a", id="1")])
+    for classifier_copy in [copy.deepcopy(classifier), pickle.loads(pickle.dumps(classifier))]:
+        output, _ = classifier_copy.run(query="", documents=[Document(content="b", id="2")])
+        assert output["documents"][0].meta["classification"]["label"] == "b"
+        assert classifier_copy.query_count == 2
+
+
+def test_document_classifier_cache():
+    classifier = MockDocumentClassifier()
+    docs = [Document(content="a", id="1"), Document(content="b", id="2")]
+    classifier.run(query="", documents=docs)
+
+    docs = [Document(content="a", id="1"), Document(content="c", id="3")]
+    output, _ = classifier.run(query="", documents=docs)
+    assert [doc.meta["classification"]["label"] for doc in output["documents"]] == ["a", "c"]
+    assert classifier.predict_calls == 2
+
+    output, _ = classifier.run(query="", documents=[Document(content="c", id="3")])
+    assert output["documents"][0].meta["classification"]["label"] == "c"
+    assert classifier.predict_calls == 2
+
+    # same id with new content is classified again
+    output, _ = classifier.run(query="", documents=[Document(content="d", id="3")])
+    assert output["documents"][0].meta["classification"]["label"] == "d"
+    assert classifier.predict_calls == 3
+
+    # changing an attribute that's part of the cache key invalidates cached results
+    classifier.model_version = "v2"
+    classifier.run(query="", documents=[Document(content="d", id="3")])
+    assert classifier.predict_calls == 4
+
+
+def test_document_classifier_cache_partial_hit():
+    classifier = MockDocumentClassifier()
+    classifier.run(query="", documents=[Document(content="a", id="1"), Document(content="b", id="2")])
+    predicted = []
+    predict = classifier.predict
+
+    def record_predict(documents):
+        predicted.extend(doc.id for doc in documents)
+        return predict(documents)
+
+    classifier.predict = record_predict
+    output, _ = classifier.run(query="", documents=[Document(content="a", id="1"), Document(content="c", id="3")])
+    assert predicted == ["3"]
+    assert [doc.meta["classification"]["label"] for doc in output["documents"]] == ["a", "c"]
+
+
+def test_document_classifier_predict_stream():
+    classifier = MockDocumentClassifier()
+    docs = (Document(content=str(i), id=str(i)) for i in range(5))
+    results = list(classifier.predict_stream(docs, batch_size=2))
+    assert [doc.meta["classification"]["label"] for doc in results] == ["0", "1", "2", "3", "4"]
+    assert classifier.predict_calls == 3
+
+
+def test_document_classifier_without_documents():
+    classifier = MockDocumentClassifier()
+    output, edge = classifier.run(query="", documents=[])
+    assert output == {"documents": []}
+    assert edge == "output_1"
+    assert classifier.predict_calls == 0
+    assert classifier.query_count == 0
+    assert classifier.empty_query_count == 1
+
+
+def test_document_classifier_subclass_without_init():
+    class NoInitDocumentClassifier(BaseDocumentClassifier):
+        def __init__(self):
+            pass
+
+        def predict(self, documents):
+            for doc in documents:
+                doc.meta["classification"] = {"label": doc.content}
+            return documents
+
+    classifier = NoInitDocumentClassifier()
+    output, _ = classifier.run(query="", documents=[Document(content="a", id="1")])
+    assert output["documents"][0].meta["classification"]["label"] == "a"
+    assert classifier.query_count == 1
+    assert NoInitDocumentClassifier.query_count == 0
+
+
+def test_document_classifier_timing():
+    classifier = MockDocumentClassifier()
+    predict = classifier.timing(classifier.predict, "query_time")
+    predict(documents=[Document(content="a", id="1")])
+    assert classifier.query_time > 0
+
+    classifier.query_time = 0
+    assert classifier.query_time_ns == 0
+
+    with pytest.raises(ValueError):
+        classifier.timing_sample_rate = 0
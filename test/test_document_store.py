@@ -1,6 +1,5 @@
 import numpy as np
 import pytest
-from elasticsearch import Elasticsearch
 
 from conftest import get_document_store
 from haystack import Document, Label, Answer, Span
@@ -207,10 +206,11 @@ def test_write_document_meta(document_store):
     documents_in_store = document_store.get_all_documents()
     assert len(documents_in_store) == 4
 
-    assert not document_store.get_document_by_id("1").meta
-    assert document_store.get_document_by_id("2").meta["meta_field"] == "test2"
-    assert not document_store.get_document_by_id("3").meta
-    assert document_store.get_document_by_id("4").meta["meta_field"] == "test4"
+    stored_docs = {doc.id: doc for doc in document_store.get_documents_by_id(["1", "2", "3", "4"])}
+    assert not stored_docs["1"].meta
+    assert stored_docs["2"].meta["meta_field"] == "test2"
+    assert not stored_docs["3"].meta
+    assert stored_docs["4"].meta["meta_field"] == "test4"
 
 
 def test_write_document_index(document_store):
@@ -228,12 +228,12 @@ def test_write_document_index(document_store):
     assert len(document_store.get_all_documents()) == 0
 
 
-def test_document_with_embeddings(document_store):
+def test_document_with_embeddings(document_store, embedding_pool):
     documents = [
-        {"content": "text1", "id": "1", "embedding": np.random.rand(768).astype(np.float32)},
-        {"content": "text2", "id": "2", "embedding": np.random.rand(768).astype(np.float64)},
-        {"content": "text3", "id": "3", "embedding": np.random.rand(768).astype(np.float32).tolist()},
-        {"content": "text4", "id": "4", "embedding": np.random.rand(768).astype(np.float32)},
+        {"content": "text1", "id": "1", "embedding": embedding_pool[0]},
+        {"content": "text2", "id": "2", "embedding": embedding_pool[1].astype(np.float64)},
+        {"content": "text3", "id": "3", "embedding": embedding_pool[2].tolist()},
+        {"content": "text4", "id": "4", "embedding": embedding_pool[3]},
     ]
     document_store.write_documents(documents, index="haystack_test_1")
     assert len(document_store.get_all_documents(index="haystack_test_1")) == 4
@@ -246,7 +246,20 @@ def test_document_with_embeddings(document_store):
 
 
 @pytest.mark.parametrize("retriever", ["embedding"], indirect=True)
-def test_update_embeddings(document_store, retriever):
+def test_update_embeddings(document_store, retriever, monkeypatch):
+    # the same passages get embedded by several update_embeddings() calls below, so only run the model once per text
+    passage_embeddings = {}
+    embed_passages = retriever.embed_passages
+
+    def cached_embed_passages(docs):
+        new_docs = [doc for doc in docs if doc.content not in passage_embeddings]
+        if new_docs:
+            for doc, embedding in zip(new_docs, embed_passages(new_docs)):
+                passage_embeddings[doc.content] = embedding
+        return [passage_embeddings[doc.content] for doc in docs]
+
+    monkeypatch.setattr(retriever, "embed_passages", cached_embed_passages)
+
     documents = []
     for i in range(6):
         documents.append({"content": f"text_{i}", "id": str(i), "meta_field": f"value_{i}"})
@@ -290,12 +303,12 @@ def test_update_embeddings(document_store, retriever):
         documents.append({"content": f"text_{i}", "id": str(i), "meta_field": f"value_{i}"})
     document_store.write_documents(documents, index="haystack_test_1")
 
-    doc_before_update = document_store.get_all_documents(index="haystack_test_1", filters={"meta_field": ["value_7"]})[0]
+    doc_before_update = document_store.get_document_by_id("7", index="haystack_test_1")
     embedding_before_update = doc_before_update.embedding
 
     # test updating only documents without embeddings
     document_store.update_embeddings(retriever, index="haystack_test_1", batch_size=3, update_existing_embeddings=False)
-    doc_after_update = document_store.get_all_documents(index="haystack_test_1", filters={"meta_field": ["value_7"]})[0]
+    doc_after_update = document_store.get_document_by_id("7", index="haystack_test_1")
     embedding_after_update = doc_after_update.embedding
     np.testing.assert_array_equal(embedding_before_update, embedding_after_update)
 
@@ -309,14 +322,14 @@ def test_update_embeddings(document_store, retriever):
         document_store.update_embeddings(
             retriever, index="haystack_test_1", batch_size=3, filters={"meta_field": ["value_0", "value_1"]}
         )
-        doc_after_update = document_store.get_all_documents(index="haystack_test_1", filters={"meta_field": ["value_7"]})[0]
+        doc_after_update = document_store.get_document_by_id("7", index="haystack_test_1")
         embedding_after_update = doc_after_update.embedding
         np.testing.assert_array_equal(embedding_before_update, embedding_after_update)
 
     # test update all embeddings
     document_store.update_embeddings(retriever, index="haystack_test_1", batch_size=3, update_existing_embeddings=True)
     assert document_store.get_embedding_count(index="haystack_test_1") == 11
-    doc_after_update = document_store.get_all_documents(index="haystack_test_1", filters={"meta_field": ["value_7"]})[0]
+    doc_after_update = document_store.get_document_by_id("7", index="haystack_test_1")
     embedding_after_update = doc_after_update.embedding
     np.testing.assert_raises(AssertionError, np.testing.assert_array_equal, embedding_before_update, embedding_after_update)
 
@@ -368,16 +381,7 @@ def test_labels(document_store):
         no_answer=False,
         origin="gold-label",
     )
-    document_store.write_labels([label], index="haystack_test_label")
-    labels = document_store.get_all_labels(index="haystack_test_label")
-    assert len(labels) == 1
-    assert label == labels[0]
-
-    # different index
-    labels = document_store.get_all_labels()
-    assert len(labels) == 0
-
-    # write second label + duplicate
+    # second label
     label2 = Label(
         query="question",
         answer=Answer(answer="another answer",
@@ -393,7 +397,8 @@ def test_labels(document_store):
         no_answer=False,
         origin="gold-label",
     )
-    document_store.write_labels([label, label2], index="haystack_test_label")
+    # write both labels + a duplicate in a single bulk request
+    document_store.write_labels([label, label, label2], index="haystack_test_label")
     labels = document_store.get_all_labels(index="haystack_test_label")
 
     # duplicate should not be there
@@ -401,6 +406,10 @@ def test_labels(document_store):
     assert label in labels
     assert label2 in labels
 
+    # different index
+    labels = document_store.get_all_labels()
+    assert len(labels) == 0
+
 
 def test_multilabel(document_store):
     labels =[
@@ -609,11 +618,11 @@ def test_update_meta(document_store):
 
 
 @pytest.mark.parametrize("document_store_type", ["elasticsearch", "memory"])
-def test_custom_embedding_field(document_store_type):
+def test_custom_embedding_field(document_store_type, embedding_pool):
     document_store = get_document_store(
         document_store_type=document_store_type, embedding_field="custom_embedding_field"
     )
-    doc_to_write = {"content": "test", "custom_embedding_field": np.random.rand(768).astype(np.float32)}
+    doc_to_write = {"content": "test", "custom_embedding_field": embedding_pool[0]}
     document_store.write_documents([doc_to_write])
     documents = document_store.get_all_documents(return_embedding=True)
     assert len(documents) == 1
@@ -659,13 +668,12 @@ def test_get_meta_values_by_key(document_store):
 
 
 @pytest.mark.elasticsearch
-def test_elasticsearch_custom_fields(elasticsearch_fixture):
-    client = Elasticsearch()
-    client.indices.delete(index='haystack_test_custom', ignore=[404])
+def test_elasticsearch_custom_fields(es_client, embedding_pool):
+    es_client.indices.delete(index='haystack_test_custom', ignore=[404])
     document_store = ElasticsearchDocumentStore(index="haystack_test_custom", content_field="custom_text_field",
                                                 embedding_field="custom_embedding_field")
 
-    doc_to_write = {"custom_text_field": "test", "custom_embedding_field": np.random.rand(768).astype(np.float32)}
+    doc_to_write = {"custom_text_field": "test", "custom_embedding_field": embedding_pool[0]}
     document_store.write_documents([doc_to_write])
     documents = document_store.get_all_documents(return_embedding=True)
     assert len(documents) == 1
@@ -674,15 +682,15 @@ def test_elasticsearch_custom_fields(elasticsearch_fixture):
 
 
 @pytest.mark.elasticsearch
-def test_get_document_count_only_documents_without_embedding_arg():
+def test_get_document_count_only_documents_without_embedding_arg(embedding_pool):
     documents = [
-        {"content": "text1", "id": "1", "embedding": np.random.rand(768).astype(np.float32), "meta_field_for_count": "a"},
-        {"content": "text2", "id": "2", "embedding": np.random.rand(768).astype(np.float64), "meta_field_for_count": "b"},
-        {"content": "text3", "id": "3", "embedding": np.random.rand(768).astype(np.float32).tolist()},
+        {"content": "text1", "id": "1", "embedding": embedding_pool[0], "meta_field_for_count": "a"},
+        {"content": "text2", "id": "2", "embedding": embedding_pool[1].astype(np.float64), "meta_field_for_count": "b"},
+        {"content": "text3", "id": "3", "embedding": embedding_pool[2].tolist()},
         {"content": "text4", "id": "4", "meta_field_for_count": "b"},
         {"content": "text5", "id": "5", "meta_field_for_count": "b"},
         {"content": "text6", "id": "6", "meta_field_for_count": "c"},
-        {"content": "text7", "id": "7", "embedding": np.random.rand(768).astype(np.float64), "meta_field_for_count": "c"},
+        {"content": "text7", "id": "7", "embedding": embedding_pool[3].astype(np.float64), "meta_field_for_count": "c"},
     ]
 
     _index: str = "haystack_test_count"
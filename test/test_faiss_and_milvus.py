@@ -1,30 +1,50 @@
+import logging
 import time
 import faiss
 import math
 import numpy as np
 import pytest
+
+from conftest import get_retriever
 from haystack import Document
-from haystack.pipeline import DocumentSearchPipeline
 from haystack.document_store.faiss import FAISSDocumentStore
 from haystack.pipeline import Pipeline
-from haystack.retriever.dense import EmbeddingRetriever
+
+# embeddings are drawn once as float32 from a seeded generator
+EMBEDDINGS = np.random.default_rng(42).random((6, 768), dtype=np.float32)
 
 DOCUMENTS = [
-    {"name": "name_1", "content": "text_1", "embedding": np.random.rand(768).astype(np.float32)},
-    {"name": "name_2", "content": "text_2", "embedding": np.random.rand(768).astype(np.float32)},
-    {"name": "name_3", "content": "text_3", "embedding": np.random.rand(768).astype(np.float64)},
-    {"name": "name_4", "content": "text_4", "embedding": np.random.rand(768).astype(np.float32)},
-    {"name": "name_5", "content": "text_5", "embedding": np.random.rand(768).astype(np.float32)},
-    {"name": "name_6", "content": "text_6", "embedding": np.random.rand(768).astype(np.float64)},
+    {"name": f"name_{i + 1}", "content": f"text_{i + 1}", "embedding": embedding}
+    for i, embedding in enumerate(EMBEDDINGS)
 ]
 
+# same documents, but rows 3 and 6 are float64 to test dtype handling (see test_faiss_handles_mixed_dtype)
+DOCUMENTS_MIXED_DTYPE = [
+    {**doc, "embedding": doc["embedding"].astype(np.float64)} if i in (2, 5) else doc
+    for i, doc in enumerate(DOCUMENTS)
+]
 
-def test_faiss_index_save_and_load(tmp_path):
-    document_store = FAISSDocumentStore(
-        sql_url=f"sqlite:////{tmp_path/'haystack_test.db'}",
+DOCUMENTS_BY_CONTENT = {doc["content"]: doc for doc in DOCUMENTS}
+
+
+@pytest.fixture(scope="module")
+def faiss_document_store_module(tmp_path_factory):
+    return FAISSDocumentStore(
+        sql_url=f"sqlite:////{tmp_path_factory.mktemp('faiss') / 'haystack_test.db'}",
         index="haystack_test",
         progress_bar=False  # Just to check if the init parameters are kept
     )
+
+
+@pytest.fixture
+def faiss_document_store(faiss_document_store_module):
+    # share one store (SQL tables + FAISS index) across the tests of this module and only clear it in between
+    yield faiss_document_store_module
+    faiss_document_store_module.delete_documents()
+
+
+def test_faiss_index_save_and_load(faiss_document_store, tmp_path, caplog):
+    document_store = faiss_document_store
     document_store.write_documents(DOCUMENTS)
 
     # test saving the index
@@ -46,13 +66,37 @@ def test_faiss_index_save_and_load(tmp_path):
     # Check if the init parameters are kept
     assert not new_document_store.progress_bar
 
+    # flat indexes can't be memory-mapped, they are read into RAM anyway
+    with caplog.at_level(logging.WARNING):
+        mmap_document_store = FAISSDocumentStore.load(tmp_path / "haystack_test_faiss", mmap=True)
+    assert "only supported for IVF indexes" in caplog.text
+    assert mmap_document_store.faiss_indexes[document_store.index].ntotal == len(DOCUMENTS)
 
-def test_faiss_index_save_and_load_custom_path(tmp_path):
+
+def test_faiss_index_load_mmap(tmp_path):
     document_store = FAISSDocumentStore(
-        sql_url=f"sqlite:////{tmp_path/'haystack_test.db'}",
-        index="haystack_test",
-        progress_bar=False  # Just to check if the init parameters are kept
+        sql_url=f"sqlite:////{tmp_path / 'haystack_test_mmap.db'}", faiss_index_factory_str="IVF1,Flat"
     )
+    document_store.train_index(DOCUMENTS)
+    document_store.write_documents(DOCUMENTS)
+    document_store.save(tmp_path / "haystack_test_faiss_mmap")
+
+    mmap_document_store = FAISSDocumentStore.load(tmp_path / "haystack_test_faiss_mmap", mmap=True)
+    faiss_index = mmap_document_store.faiss_indexes[document_store.index]
+    assert faiss_index.ntotal == len(DOCUMENTS)
+    # the inverted lists are mapped from the file instead of being read into RAM
+    invlists = faiss.downcast_InvertedLists(faiss.extract_index_ivf(faiss_index).invlists)
+    assert isinstance(invlists, faiss.OnDiskInvertedLists)
+    # the mapped index is read-only
+    with pytest.raises(RuntimeError):
+        faiss_index.add(EMBEDDINGS[:1])
+
+    result = mmap_document_store.query_by_embedding(query_emb=EMBEDDINGS[0], top_k=1)
+    assert result[0].content == DOCUMENTS[0]["content"]
+
+
+def test_faiss_index_save_and_load_custom_path(faiss_document_store, tmp_path):
+    document_store = faiss_document_store
     document_store.write_documents(DOCUMENTS)
 
     # test saving the index
@@ -81,21 +125,40 @@ def test_faiss_index_save_and_load_custom_path(tmp_path):
 def test_faiss_write_docs(document_store, index_buffer_size, batch_size):
     document_store.index_buffer_size = index_buffer_size
 
-    # Write in small batches
-    for i in range(0, len(DOCUMENTS), batch_size):
-        document_store.write_documents(DOCUMENTS[i: i + batch_size])
+    if index_buffer_size >= len(DOCUMENTS):
+        document_store.write_documents(DOCUMENTS)
+    else:
+        # Write in small batches
+        for i in range(0, len(DOCUMENTS), batch_size):
+            document_store.write_documents(DOCUMENTS[i: i + batch_size])
 
     documents_indexed = document_store.get_all_documents()
     assert len(documents_indexed) == len(DOCUMENTS)
 
     # test if correct vectors are associated with docs
-    for i, doc in enumerate(documents_indexed):
-        # we currently don't get the embeddings back when we call document_store.get_all_documents()
-        original_doc = [d for d in DOCUMENTS if d["content"] == doc.content][0]
-        stored_emb = document_store.faiss_indexes[document_store.index].reconstruct(int(doc.meta["vector_id"]))
-        # compare original input vec with stored one (ignore extra dim added by hnsw)
-        assert np.allclose(original_doc["embedding"], stored_emb, rtol=0.01)
-        
+    # we currently don't get the embeddings back when we call document_store.get_all_documents(),
+    # so reconstruct all stored vectors from the index at once
+    stored_embs = document_store.faiss_indexes[document_store.index].reconstruct_n(0, len(DOCUMENTS))
+    vector_ids = np.fromiter((int(doc.meta["vector_id"]) for doc in documents_indexed), dtype=np.int64)
+    original_embs = np.stack([DOCUMENTS_BY_CONTENT[doc.content]["embedding"] for doc in documents_indexed])
+    # compare original input vecs with stored ones
+    np.testing.assert_allclose(original_embs, stored_embs[vector_ids], atol=1e-5)
+
+
+@pytest.mark.parametrize("document_store", ["faiss"], indirect=True)
+def test_faiss_handles_mixed_dtype(document_store):
+    document_store.write_documents(DOCUMENTS_MIXED_DTYPE)
+
+    documents_indexed = document_store.get_all_documents()
+    assert len(documents_indexed) == len(DOCUMENTS_MIXED_DTYPE)
+
+    # float64 embeddings are cast to float32 when added to the index
+    stored_embs = document_store.faiss_indexes[document_store.index].reconstruct_n(0, len(DOCUMENTS_MIXED_DTYPE))
+    assert stored_embs.dtype == np.float32
+    vector_ids = np.fromiter((int(doc.meta["vector_id"]) for doc in documents_indexed), dtype=np.int64)
+    original_embs = np.stack([DOCUMENTS_BY_CONTENT[doc.content]["embedding"] for doc in documents_indexed])
+    np.testing.assert_allclose(original_embs, stored_embs[vector_ids], atol=1e-5)
+
 
 @pytest.mark.slow
 @pytest.mark.parametrize("retriever", ["dpr"], indirect=True)
@@ -110,18 +173,30 @@ def test_update_docs(document_store, retriever, batch_size):
     assert len(documents_indexed) == len(DOCUMENTS)
 
     # test if correct vectors are associated with docs
-    for doc in documents_indexed:
-        original_doc = [d for d in DOCUMENTS if d["content"] == doc.content][0]
-        updated_embedding = retriever.embed_passages([Document.from_dict(original_doc)])
+    updated_embeddings = retriever.embed_passages(
+        [Document.from_dict(DOCUMENTS_BY_CONTENT[doc.content]) for doc in documents_indexed]
+    )
+    for doc, updated_embedding in zip(documents_indexed, updated_embeddings):
         stored_doc = document_store.get_all_documents(filters={"name": [doc.meta["name"]]})[0]
         # compare original input vec with stored one (ignore extra dim added by hnsw)
-        assert np.allclose(updated_embedding, stored_doc.embedding, rtol=0.01)
+        # the embeddings are computed again in a differently sized batch, which adds some float32 noise
+        np.testing.assert_allclose(updated_embedding, stored_doc.embedding, atol=1e-4)
+
+
+class CounterRetriever:
+    """Returns a different constant embedding on each call of embed_passages()."""
+    def __init__(self):
+        self.n = 0
+
+    def embed_passages(self, docs):
+        self.n += 1
+        return [np.full(768, self.n, dtype=np.float32)] * len(docs)
 
 
-@pytest.mark.slow
-@pytest.mark.parametrize("retriever", ["dpr"], indirect=True)
 @pytest.mark.parametrize("document_store", ["milvus", "faiss"], indirect=True)
-def test_update_existing_docs(document_store, retriever):
+def test_update_existing_docs(document_store):
+    # only the id handling is tested here, the embeddings just need to differ between the two updates
+    retriever = CounterRetriever()
     document_store.duplicate_documents = "overwrite"
     old_document = Document(content="text_1")
     # initial write
@@ -158,22 +233,15 @@ def test_update_with_empty_store(document_store, retriever):
     assert len(documents_indexed) == len(DOCUMENTS)
 
 
-@pytest.mark.parametrize("index_factory", ["Flat", "HNSW", "IVF1,Flat"])
-def test_faiss_retrieving(index_factory, tmp_path):
+def test_faiss_retrieving_flat():
     document_store = FAISSDocumentStore(
-        sql_url=f"sqlite:////{tmp_path/'test_faiss_retrieving.db'}", faiss_index_factory_str=index_factory
+        sql_url="sqlite://", faiss_index_factory_str="Flat"
     )
 
     document_store.delete_all_documents(index="document")
-    if "ivf" in index_factory.lower():
-        document_store.train_index(DOCUMENTS)
     document_store.write_documents(DOCUMENTS)
 
-    retriever = EmbeddingRetriever(
-        document_store=document_store,
-        embedding_model="deepset/sentence_bert",
-        use_gpu=False
-    )
+    retriever = get_retriever("embedding", document_store)
     result = retriever.retrieve(query="How to test this?")
 
     assert len(result) == len(DOCUMENTS)
@@ -183,15 +251,67 @@ def test_faiss_retrieving(index_factory, tmp_path):
     document_store.faiss_indexes[document_store.index].reset()
 
 
+@pytest.fixture(scope="module")
+def large_embeddings():
+    # approximate indexes only behave like they do in production with a realistic number of vectors,
+    # training IVF or building the HNSW graph on a handful of documents doesn't test anything
+    return np.random.default_rng(0).standard_normal((10_000, 768), dtype=np.float32)
+
+
+@pytest.fixture(scope="module")
+def large_documents(large_embeddings):
+    return [{"content": f"text_{i}", "embedding": embedding} for i, embedding in enumerate(large_embeddings)]
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("index_factory", ["Flat", "HNSW", "IVF100,Flat"])
+def test_faiss_retrieving_approx(index_factory, large_documents):
+    document_store = FAISSDocumentStore(
+        sql_url="sqlite://", faiss_index_factory_str=index_factory
+    )
+
+    if "ivf" in index_factory.lower():
+        document_store.train_index(large_documents)
+    document_store.write_documents(large_documents)
+
+    # querying with a stored vector has to return the document of that vector
+    query = large_documents[42]
+    result = document_store.query_by_embedding(query_emb=query["embedding"], top_k=10)
+
+    assert len(result) == 10
+    assert query["content"] in [doc.content for doc in result]
+
+
+@pytest.mark.slow
+def test_faiss_sq8_recall(large_embeddings, large_documents):
+    document_store = FAISSDocumentStore(sql_url="sqlite://", faiss_index_factory_str="SQ8")
+    # the scalar quantizer learns the value range of each dimension
+    document_store.train_index(large_documents)
+    document_store.write_documents(large_documents)
+
+    queries = np.random.default_rng(1).standard_normal((100, 768), dtype=np.float32)
+    # exact top 10 by inner product, i.e. the result of a Flat index
+    exact_top_k = np.argsort(-queries @ large_embeddings.T, axis=1)[:, :10]
+
+    hits = 0
+    for query, exact_ids in zip(queries, exact_top_k):
+        result = document_store.query_by_embedding(query_emb=query, top_k=10)
+        hits += len({doc.content for doc in result} & {f"text_{i}" for i in exact_ids})
+    recall = hits / exact_top_k.size
+
+    # int8 quantization must not silently degrade retrieval quality
+    assert recall >= 0.95
+
+
 @pytest.mark.parametrize("retriever", ["embedding"], indirect=True)
 @pytest.mark.parametrize("document_store", ["faiss", "milvus"], indirect=True)
 def test_finding(document_store, retriever):
     document_store.write_documents(DOCUMENTS)
-    pipe = DocumentSearchPipeline(retriever=retriever)
 
-    prediction = pipe.run(query="How to test this?", params={"top_k": 1})
+    # the Pipeline plumbing is covered by test_pipeline, so query the retriever directly
+    documents = retriever.retrieve(query="How to test this?", top_k=1)
 
-    assert len(prediction.get('documents', [])) == 1
+    assert len(documents) == 1
 
 
 @pytest.mark.slow
@@ -213,20 +333,14 @@ def test_delete_docs_with_filters(document_store, retriever):
 @pytest.mark.parametrize("retriever", ["embedding"], indirect=True)
 @pytest.mark.parametrize("document_store", ["faiss", "milvus"], indirect=True)
 def test_pipeline(document_store, retriever):
-    documents = [
-        {"name": "name_1", "content": "text_1", "embedding": np.random.rand(768).astype(np.float32)},
-        {"name": "name_2", "content": "text_2", "embedding": np.random.rand(768).astype(np.float32)},
-        {"name": "name_3", "content": "text_3", "embedding": np.random.rand(768).astype(np.float64)},
-        {"name": "name_4", "content": "text_4", "embedding": np.random.rand(768).astype(np.float32)},
-    ]
-    document_store.write_documents(documents)
+    document_store.write_documents(DOCUMENTS[:4])
     pipeline = Pipeline()
     pipeline.add_node(component=retriever, name="FAISS", inputs=["Query"])
     output = pipeline.run(query="How to test this?", params={"top_k": 3})
     assert len(output["documents"]) == 3
 
 
-def test_faiss_passing_index_from_outside(tmp_path):
+def test_faiss_passing_index_from_outside():
     d = 768
     nlist = 2
     quantizer = faiss.IndexFlatIP(d)
@@ -235,7 +349,7 @@ def test_faiss_passing_index_from_outside(tmp_path):
     faiss_index.set_direct_map_type(faiss.DirectMap.Hashtable)
     faiss_index.nprobe = 2
     document_store = FAISSDocumentStore(
-        sql_url=f"sqlite:////{tmp_path/'haystack_test_faiss.db'}", faiss_index=faiss_index, index=index
+        sql_url="sqlite://", faiss_index=faiss_index, index=index
     )
 
     document_store.delete_documents()
@@ -250,9 +364,9 @@ def test_faiss_passing_index_from_outside(tmp_path):
         assert 0 <= int(doc.meta["vector_id"]) <= 7
 
 
-def test_faiss_cosine_similarity(tmp_path):
+def test_faiss_cosine_similarity():
     document_store = FAISSDocumentStore(
-        sql_url=f"sqlite:////{tmp_path/'haystack_test_faiss.db'}", similarity='cosine'
+        sql_url="sqlite://", similarity='cosine'
     )
 
     # below we will write documents to the store and then query it to see if vectors were normalized
@@ -266,41 +380,40 @@ def test_faiss_cosine_similarity(tmp_path):
 
     # check if search with cosine similarity returns the correct number of results
     assert len(query_results) == len(DOCUMENTS)
-    indexed_docs = {}
-    for doc in DOCUMENTS:
-        indexed_docs[doc["content"]] = doc["embedding"]
 
+    # check if the stored embeddings were normalized
+    original_embs = np.stack([DOCUMENTS_BY_CONTENT[doc.content]["embedding"] for doc in query_results]).astype(np.float32)
+    faiss.normalize_L2(original_embs)
+    result_embs = np.stack([doc.embedding for doc in query_results])
+    np.testing.assert_allclose(original_embs, result_embs, atol=1e-5)
+
+    # check if the scores are plausible for cosine similarity
     for doc in query_results:
-        result_emb = doc.embedding
-        original_emb = np.array([indexed_docs[doc.content]], dtype="float32")
-        faiss.normalize_L2(original_emb)
-
-        # check if the stored embedding was normalized
-        assert np.allclose(original_emb[0], result_emb, rtol=0.01)
-        
-        # check if the score is plausible for cosine similarity
         assert 0 <= doc.score <= 1.0
 
     # now check if vectors are normalized when updating embeddings
     class MockRetriever():
+        def __init__(self):
+            self.rng = np.random.default_rng(0)
+
         def embed_passages(self, docs):
-            return [np.random.rand(768).astype(np.float32) for doc in docs]
+            return list(self.rng.standard_normal((len(docs), 768), dtype=np.float32))
 
     retriever = MockRetriever()
     document_store.update_embeddings(retriever=retriever)
     query_results = document_store.query_by_embedding(query_emb=query, top_k=len(DOCUMENTS), return_embedding=True)
 
-    for doc in query_results:
-        original_emb = np.array([indexed_docs[doc.content]], dtype="float32")
-        faiss.normalize_L2(original_emb)
-        # check if the original embedding has changed after updating the embeddings
-        assert not np.allclose(original_emb[0], doc.embedding, rtol=0.01)
+    original_embs = np.stack([DOCUMENTS_BY_CONTENT[doc.content]["embedding"] for doc in query_results]).astype(np.float32)
+    faiss.normalize_L2(original_embs)
+    result_embs = np.stack([doc.embedding for doc in query_results])
+    # check if each original embedding has changed after updating the embeddings
+    assert not np.isclose(original_embs, result_embs, atol=1e-3).all(axis=1).any()
 
 
 
-def test_faiss_cosine_sanity_check(tmp_path):
+def test_faiss_cosine_sanity_check():
     document_store = FAISSDocumentStore(
-        sql_url=f"sqlite:////{tmp_path/'haystack_test_faiss.db'}", similarity='cosine',
+        sql_url="sqlite://", similarity='cosine',
         vector_dim=3
     )
 
@@ -1,11 +1,14 @@
+import os
 from pathlib import Path
 
-import json
 import math
+import numpy as np
 import pytest
 
+from conftest import get_retriever
 from haystack.document_store.elasticsearch import ElasticsearchDocumentStore
 from haystack.pipeline import (
+    _load_yaml,
     JoinDocuments,
     Pipeline,
     FAQPipeline,
@@ -15,12 +18,27 @@ from haystack.pipeline import (
     TransformersQueryClassifier,
     MostSimilarDocumentsPipeline,
 )
-from haystack.reader import FARMReader
-from haystack.retriever.dense import DensePassageRetriever
 from haystack.retriever.sparse import ElasticsearchRetriever
 from haystack.schema import Document
 
 
+def test_load_yaml_cache(tmp_path):
+    path = tmp_path / "pipeline.yaml"
+    path.write_text("version: '0.8'\ncomponents: []\n")
+    mtime_ns = path.stat().st_mtime_ns
+
+    data = _load_yaml(path)
+    assert data == {"version": "0.8", "components": []}
+    # callers get a copy and can't alter the cached result
+    data["components"].append({"name": "Retriever"})
+    assert _load_yaml(path)["components"] == []
+
+    # a file changed within the mtime resolution is not served from the cache
+    path.write_text("version: '0.9'\ncomponents: [1]\n")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    assert _load_yaml(path) == {"version": "0.9", "components": [1]}
+
+
 @pytest.mark.elasticsearch
 @pytest.mark.parametrize("document_store", ["elasticsearch"], indirect=True)
 def test_load_and_save_yaml(document_store, tmp_path):
@@ -85,12 +103,31 @@ def test_load_and_save_yaml(document_store, tmp_path):
     ).replace("\n", "")
 
 
+def assert_acyclic(obj, ancestors=None):
+    """
+    Fail if a dict or list contains itself, i.e. if the object can't be serialized with json.dumps().
+    Unlike json.dumps(), this doesn't build the serialized string.
+    """
+    ancestors = ancestors if ancestors is not None else set()
+    if isinstance(obj, dict):
+        children = obj.values()
+    elif isinstance(obj, (list, tuple)):
+        children = obj
+    else:
+        return
+    assert id(obj) not in ancestors, "Circular reference detected"
+    ancestors.add(id(obj))
+    for child in children:
+        assert_acyclic(child, ancestors)
+    ancestors.remove(id(obj))
+
+
 @pytest.mark.elasticsearch
 @pytest.mark.parametrize("document_store_with_docs", ["elasticsearch"], indirect=True)
-def test_debug_attributes_global(document_store_with_docs, tmp_path):
+def test_debug_attributes_global(document_store_with_docs, roberta_reader, tmp_path):
 
     es_retriever = ElasticsearchRetriever(document_store=document_store_with_docs)
-    reader = FARMReader(model_name_or_path="deepset/roberta-base-squad2")
+    reader = roberta_reader
 
     pipeline = Pipeline()
     pipeline.add_node(component=es_retriever, name="ESRetriever", inputs=["Query"])
@@ -114,15 +151,15 @@ def test_debug_attributes_global(document_store_with_docs, tmp_path):
     assert prediction["_debug"]["Reader"]["input"]
     assert prediction["_debug"]["Reader"]["output"]
 
-    # Avoid circular reference: easiest way to detect those is to use json.dumps
-    json.dumps(prediction, default=str)
+    # Avoid circular reference
+    assert_acyclic(prediction)
 
 @pytest.mark.elasticsearch
 @pytest.mark.parametrize("document_store_with_docs", ["elasticsearch"], indirect=True)
-def test_debug_attributes_per_node(document_store_with_docs, tmp_path):
+def test_debug_attributes_per_node(document_store_with_docs, roberta_reader, tmp_path):
 
     es_retriever = ElasticsearchRetriever(document_store=document_store_with_docs)
-    reader = FARMReader(model_name_or_path="deepset/roberta-base-squad2")
+    reader = roberta_reader
 
     pipeline = Pipeline()
     pipeline.add_node(component=es_retriever, name="ESRetriever", inputs=["Query"])
@@ -143,16 +180,16 @@ def test_debug_attributes_per_node(document_store_with_docs, tmp_path):
     assert prediction["_debug"]["ESRetriever"]["input"]
     assert prediction["_debug"]["ESRetriever"]["output"]
 
-    # Avoid circular reference: easiest way to detect those is to use json.dumps
-    json.dumps(prediction, default=str)
+    # Avoid circular reference
+    assert_acyclic(prediction)
 
 
 @pytest.mark.elasticsearch
 @pytest.mark.parametrize("document_store_with_docs", ["elasticsearch"], indirect=True)
-def test_global_debug_attributes_override_node_ones(document_store_with_docs, tmp_path):
+def test_global_debug_attributes_override_node_ones(document_store_with_docs, roberta_reader, tmp_path):
 
     es_retriever = ElasticsearchRetriever(document_store=document_store_with_docs)
-    reader = FARMReader(model_name_or_path="deepset/roberta-base-squad2")
+    reader = roberta_reader
 
     pipeline = Pipeline()
     pipeline.add_node(component=es_retriever, name="ESRetriever", inputs=["Query"])
@@ -197,20 +234,26 @@ def test_global_debug_attributes_override_node_ones(document_store_with_docs, tm
 #     [("elasticsearch", "elasticsearch")],
 #     indirect=True,
 # )
+# The graph checks don't depend on the retriever, so only the cheapest combination runs by default
 @pytest.mark.parametrize(
     "retriever_with_docs,document_store_with_docs",
     [
-        ("dpr", "elasticsearch"),
-        ("dpr", "faiss"),
-        ("dpr", "memory"),
-        ("dpr", "milvus"),
-        ("embedding", "elasticsearch"),
-        ("embedding", "faiss"),
-        ("embedding", "memory"),
-        ("embedding", "milvus"),
-        ("elasticsearch", "elasticsearch"),
-        ("es_filter_only", "elasticsearch"),
         ("tfidf", "memory"),
+        *[
+            pytest.param(retriever, document_store, marks=pytest.mark.slow)
+            for retriever, document_store in [
+                ("dpr", "elasticsearch"),
+                ("dpr", "faiss"),
+                ("dpr", "memory"),
+                ("dpr", "milvus"),
+                ("embedding", "elasticsearch"),
+                ("embedding", "faiss"),
+                ("embedding", "memory"),
+                ("embedding", "milvus"),
+                ("elasticsearch", "elasticsearch"),
+                ("es_filter_only", "elasticsearch"),
+            ]
+        ],
     ],
     indirect=True,
 )
@@ -305,6 +348,13 @@ def test_faq_pipeline(retriever, document_store):
         output = pipeline.run(query="How to test this?", params={"filters": {"source": ["wiki2"]}, "top_k": 5})
         assert len(output["answers"]) == 1
 
+    queries = ["How to test this?", "How to test module-1?", "How to test module-2?"]
+    outputs = pipeline.run_batch(queries=queries, params={"top_k": 3})
+    assert [output["query"] for output in outputs] == queries
+    for output in outputs:
+        assert len(output["answers"]) == 3
+        assert output["answers"][0].answer.startswith("Using tests")
+
 
 @pytest.mark.parametrize("retriever_with_docs", ["embedding"], indirect=True)
 def test_document_search_pipeline(retriever, document_store):
@@ -327,18 +377,18 @@ def test_document_search_pipeline(retriever, document_store):
         output = pipeline.run(query="How to test this?", params={"filters": {"source": ["wiki2"]}, "top_k": 5})
         assert len(output["documents"]) == 1
 
+    queries = ["How to test this?", "Sample text", "document-3"]
+    outputs = pipeline.run_batch(queries=queries, params={"Retriever": {"top_k": 4}})
+    assert [output["query"] for output in outputs] == queries
+    assert all(len(output["documents"]) == 4 for output in outputs)
+
 
 @pytest.mark.elasticsearch
 @pytest.mark.parametrize("document_store_with_docs", ["elasticsearch"], indirect=True)
 @pytest.mark.parametrize("reader", ["farm"], indirect=True)
 def test_join_document_pipeline(document_store_with_docs, reader):
     es = ElasticsearchRetriever(document_store=document_store_with_docs)
-    dpr = DensePassageRetriever(
-        document_store=document_store_with_docs,
-        query_embedding_model="facebook/dpr-question_encoder-single-nq-base",
-        passage_embedding_model="facebook/dpr-ctx_encoder-single-nq-base",
-        use_gpu=False,
-    )
+    dpr = get_retriever("dpr", document_store_with_docs)
     document_store_with_docs.update_embeddings(dpr)
 
     query = "Where does Carla live?"
@@ -383,6 +433,13 @@ def test_join_document_pipeline(document_store_with_docs, reader):
     assert results["answers"][0].answer == "Berlin" or results["answers"][1].answer == "Berlin"
 
 
+def test_join_merge_weights_mismatch():
+    join_node = JoinDocuments(join_mode="merge", weights=[1, 1, 1])
+    inputs = [{"documents": [Document(content="text", score=0.5)]}, {"documents": [Document(content="text", score=0.7)]}]
+    with pytest.raises(ValueError, match="3 weights for 2 inputs"):
+        join_node.run(inputs=inputs)
+
+
 def test_debug_info_propagation():
     class A(RootNode):
         def run(self):
@@ -415,6 +472,37 @@ def test_debug_info_propagation():
     assert output["_debug"]["B"]["debug_key_b"] == "debug_value_b"
 
 
+def test_nodes_modifying_documents_dont_change_their_inputs():
+    class Passthrough(RootNode):
+        def run(self, documents):
+            return {"documents": documents}, "output_1"
+
+    class Translator(RootNode):
+        # modifies the documents in place like TransformersTranslator / EntityExtractor
+        def run(self, documents):
+            for doc in documents:
+                doc.content = "translated"
+                doc.meta["entities"] = ["entity"]
+            return {"documents": documents}, "output_1"
+
+    documents = [Document(content="original", meta={"name": "doc"}, embedding=np.ones(768, dtype=np.float32))]
+    pipeline = Pipeline()
+    pipeline.add_node(name="Passthrough", component=Passthrough(), inputs=["Query"])
+    pipeline.add_node(name="Translator", component=Translator(), inputs=["Passthrough"])
+    output = pipeline.run(query="test", documents=documents, params={"Passthrough": {"debug": True}})
+
+    assert output["documents"][0].content == "translated"
+    assert output["documents"][0].meta == {"name": "doc", "entities": ["entity"]}
+    # embeddings are not copied at every node
+    assert output["documents"][0].embedding is documents[0].embedding
+    # neither the caller's documents nor the debug output of the preceding node are changed
+    assert documents[0].content == "original"
+    assert documents[0].meta == {"name": "doc"}
+    upstream_doc = output["_debug"]["Passthrough"]["output"]["documents"][0]
+    assert upstream_doc.content == "original"
+    assert upstream_doc.meta == {"name": "doc"}
+
+
 def test_parallel_paths_in_pipeline_graph():
     class A(RootNode):
         def run(self):
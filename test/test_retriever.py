@@ -2,7 +2,6 @@ import time
 
 import numpy as np
 import pytest
-from elasticsearch import Elasticsearch
 from haystack import Document
 from haystack.document_store.elasticsearch import ElasticsearchDocumentStore
 from haystack.document_store.faiss import FAISSDocumentStore
@@ -92,9 +91,8 @@ def test_retrieval(retriever_with_docs, document_store_with_docs):
 
 
 @pytest.mark.elasticsearch
-def test_elasticsearch_custom_query(elasticsearch_fixture):
-    client = Elasticsearch()
-    client.indices.delete(index="haystack_test_custom", ignore=[404])
+def test_elasticsearch_custom_query(es_client):
+    es_client.indices.delete(index="haystack_test_custom", ignore=[404])
     document_store = ElasticsearchDocumentStore(
         index="haystack_test_custom", content_field="custom_text_field", embedding_field="custom_embedding_field"
     )
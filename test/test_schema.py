@@ -132,6 +132,14 @@ def test_doc_to_json():
     assert d == d_new
 
 
+def test_doc_from_dicts():
+    doc = Document(content="already a doc")
+    docs = Document.from_dicts([{"text": "some text", "name": "doc1"}, doc],
+                               field_map={"text": "content"})
+    assert docs[0] == Document(content="some text", meta={"name": "doc1"})
+    assert docs[1] is doc
+
+
 def test_answer_postinit():
     a = Answer(answer="test", offsets_in_document=[{"start": 10, "end": 20}])
     assert a.meta == {}
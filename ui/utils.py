@@ -1,33 +1,62 @@
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import logging
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
 
 API_ENDPOINT = os.getenv("API_ENDPOINT", "http://localhost:8000")
 STATUS = "initialized"
 DOC_REQUEST = "query"
 DOC_FEEDBACK = "feedback"
 DOC_UPLOAD = "file-upload"
+# A successful status check is reused for this many seconds, so not every rerun waits for the API.
+# Failed checks are not cached: the UI picks up a backend that just came up on the next rerun.
+STATUS_TTL = 30
+
+_last_ready = 0.0
+
+# One session for all calls to the API, so connections are kept alive across reruns instead of opening a new
+# one per request. The pool is sized for a few concurrent script runs / uploads.
+session = requests.Session()
+session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Feedback is sent in the background so that the UI doesn't wait for the API on every feedback click
+_feedback_executor = ThreadPoolExecutor(max_workers=1)
+
+
+def haystack_was_ready():
+    """Whether the last successful status check is recent enough to skip checking again."""
+    return time.monotonic() - _last_ready < STATUS_TTL
 
 
 def haystack_is_ready():
+    global _last_ready
+    if haystack_was_ready():
+        return True
     url = f"{API_ENDPOINT}/{STATUS}"
     try:
-        if requests.get(url).json():
+        if session.get(url).json():
+            _last_ready = time.monotonic()
             return True
     except Exception as e:
         logging.exception(e)
     return False
 
 
-@st.cache(show_spinner=False)
+# Results are cached per (query, filters, top_k_reader, top_k_retriever), e.g. for reruns caused by feedback clicks.
+# The ttl makes newly uploaded documents show up eventually. The UI doesn't modify the results, so skip
+# st.cache's hashing of the returned results on every hit.
+@st.cache(show_spinner=False, ttl=600, allow_output_mutation=True)
 def retrieve_doc(query, filters=None, top_k_reader=5, top_k_retriever=5):
     # Query Haystack API
     url = f"{API_ENDPOINT}/{DOC_REQUEST}"
     params = {"filters": filters, "ESRetriever": {"top_k": top_k_retriever}, "Reader": {"top_k": top_k_reader}}
     req = {"query": query, "params": params}
-    response_raw = requests.post(url, json=req).json()
+    response_raw = session.post(url, json=req).json()
 
     # Format response
     result = []
@@ -62,12 +91,27 @@ def feedback_doc(question, is_correct_answer, document_id, model_id, is_correct_
         "answer": answer,
         "offset_start_in_doc": offset_start_in_doc,
     }
-    response_raw = requests.post(url, json=req).json()
+    response_raw = session.post(url, json=req).json()
     return response_raw
 
 
+def _log_feedback_error(future):
+    if future.exception() is not None:
+        logging.error("Sending feedback failed", exc_info=future.exception())
+
+
+def submit_feedback(*args, **kwargs):
+    """
+    Send feedback via `feedback_doc()` in a background thread and return immediately.
+    Takes the same arguments as `feedback_doc()`. Errors are logged.
+    """
+    future = _feedback_executor.submit(feedback_doc, *args, **kwargs)
+    future.add_done_callback(_log_feedback_error)
+    return future
+
+
 def upload_doc(file):
     url = f"{API_ENDPOINT}/{DOC_UPLOAD}"
     files = [("files", file)]
-    response_raw = requests.post(url, files=files).json()
+    response_raw = session.post(url, files=files).json()
     return response_raw
@@ -1,29 +1,42 @@
+import html
 import os
+import random
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import logging
 import pandas as pd
 import streamlit as st
-from annotated_text import annotated_text
 
-# streamlit does not support any states out of the box. On every button click, streamlit reload the whole page
-# and every value gets lost. To keep track of our feedback state we use the official streamlit gist mentioned
-# here https://gist.github.com/tvst/036da038ab3e999a64497f42de966a92
-import SessionState
-from utils import feedback_doc, haystack_is_ready, retrieve_doc, upload_doc
+from utils import haystack_is_ready, haystack_was_ready, retrieve_doc, submit_feedback, upload_doc
 
 # Adjust to a question that you would like users to see in the search bar when they load the UI:
 DEFAULT_QUESTION_AT_STARTUP = "Who is the father of Arya Stark?"
 
+MARKDOWN_SPECIAL_CHARS = re.compile(r"([\\`*_{}\[\]()#+\-.!|~$])")
+
+
+def escape_markdown(text):
+    """ Escape HTML and markdown syntax, so that document text is displayed as is by st.markdown() """
+    return html.escape(MARKDOWN_SPECIAL_CHARS.sub(r"\\\1", text))
+
 
 def annotate_answer(answer, context):
     """ If we are using an extractive QA pipeline, we'll get answers
     from the API that we highlight in the given context"""
     start_idx = context.find(answer)
+    if start_idx == -1:
+        st.markdown(escape_markdown(context))
+        return
     end_idx = start_idx + len(answer)
-    # calculate dynamic height depending on context length
-    height = int(len(context) * 0.50) + 5
-    annotated_text(context[:start_idx], (answer, "ANSWER", "#8ef"), context[end_idx:], height=height)
+    # plain markdown instead of an annotated_text component, which renders every result in its own iframe
+    st.markdown(
+        f"{escape_markdown(context[:start_idx])}"
+        f"<mark style='background-color: #8ef'>{escape_markdown(answer)}</mark>"
+        f"{escape_markdown(context[end_idx:])}",
+        unsafe_allow_html=True,
+    )
 
 
 def show_plain_documents(text):
@@ -32,23 +45,35 @@ def show_plain_documents(text):
     st.markdown(text)
 
 
-def random_questions(df):
+@st.cache(show_spinner=False, allow_output_mutation=True)
+def load_eval_labels(path, mtime):
+    """
+    Read the questions and answers of the eval CSV once instead of on every rerun. `mtime` is only part
+    of the cache key, so the file is parsed again when it changes on disk.
+    """
+    df = pd.read_csv(path, sep=";", usecols=["Question Text", "Answer"])
+    return df["Question Text"].to_numpy(), df["Answer"].to_numpy()
+
+
+def random_questions(questions, answers):
     """
     Helper to get one random question + gold random_answer from the user's CSV 'eval_labels_example'.
     This can then be shown in the UI when the evaluation mode is selected. Users can easily give feedback on the
     model's results and "enrich" the eval dataset with more acceptable labels
     """
-    random_row = df.sample(1)
-    random_question = random_row["Question Text"].values[0]
-    random_answer = random_row["Answer"].values[0]
-    return random_question, random_answer
+    i = random.randrange(len(questions))
+    return questions[i], answers[i]
 
 
 def main():
-    # Define state
-    state_question = SessionState.get(
-        random_question=DEFAULT_QUESTION_AT_STARTUP, random_answer="", next_question="false", run_query="false"
-    )
+    # Define state. On every button click, streamlit reruns the whole script, st.session_state keeps values across reruns
+    for state_key, value in {
+        "random_question": DEFAULT_QUESTION_AT_STARTUP,
+        "random_answer": "",
+        "next_question": "false",
+        "run_query": "false",
+    }.items():
+        st.session_state.setdefault(state_key, value)
 
     # Initialize variables
     eval_mode = False
@@ -58,70 +83,68 @@ def main():
     # UI search bar and sidebar
     st.write("# Exafluence Demo")
     st.sidebar.header("Options")
-    top_k_reader = st.sidebar.slider("Max. number of answers", min_value=1, max_value=10, value=3, step=1)
-    top_k_retriever = st.sidebar.slider(
-        "Max. number of documents from retriever", min_value=1, max_value=10, value=3, step=1
-    )
+    # Sliders inside a form only trigger a rerun when the form is submitted, not on every tick while dragging
+    with st.sidebar.form("search_options"):
+        top_k_reader = st.slider("Max. number of answers", min_value=1, max_value=10, value=3, step=1)
+        top_k_retriever = st.slider(
+            "Max. number of documents from retriever", min_value=1, max_value=10, value=3, step=1
+        )
+        st.form_submit_button("Apply")
     eval_mode = st.sidebar.checkbox("Evaluation mode")
     debug = st.sidebar.checkbox("Show debug info")
 
     st.sidebar.write("## File Upload:")
     data_files = st.sidebar.file_uploader("", type=["pdf", "txt", "docx"], accept_multiple_files=True)
-    for data_file in data_files:
-        # Upload file
-        if data_file:
-            raw_json = upload_doc(data_file)
+    # Upload files concurrently, the requests are IO-bound
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        upload_responses = list(executor.map(upload_doc, [data_file for data_file in data_files if data_file]))
+    for raw_json in upload_responses:
+        st.sidebar.write(raw_json)
+        if debug:
+            st.subheader("REST API JSON response")
             st.sidebar.write(raw_json)
-            if debug:
-                st.subheader("REST API JSON response")
-                st.sidebar.write(raw_json)
 
     # load csv into pandas dataframe
     if eval_mode:
         try:
-            df = pd.read_csv(eval_labels, sep=";")
+            questions, answers = load_eval_labels(eval_labels, os.path.getmtime(eval_labels))
         except Exception:
             sys.exit("The eval file was not found. Please check the README for more information.")
-        if (
-            state_question
-            and hasattr(state_question, "next_question")
-            and hasattr(state_question, "random_question")
-            and state_question.next_question
-        ):
-            random_question = state_question.random_question
-            random_answer = state_question.random_answer
+        if st.session_state.next_question:
+            random_question = st.session_state.random_question
+            random_answer = st.session_state.random_answer
         else:
-            random_question, random_answer = random_questions(df)
-            state_question.random_question = random_question
-            state_question.random_answer = random_answer
+            random_question, random_answer = random_questions(questions, answers)
+            st.session_state.random_question = random_question
+            st.session_state.random_answer = random_answer
 
     # Get next random question from the CSV
     if eval_mode:
         next_question = st.button("Load new question")
         if next_question:
-            random_question, random_answer = random_questions(df)
-            state_question.random_question = random_question
-            state_question.random_answer = random_answer
-            state_question.next_question = True
-            state_question.run_query = False
+            random_question, random_answer = random_questions(questions, answers)
+            st.session_state.random_question = random_question
+            st.session_state.random_answer = random_answer
+            st.session_state.next_question = True
+            st.session_state.run_query = False
         else:
-            state_question.next_question = False
+            st.session_state.next_question = False
 
     # Search bar
     question = st.text_input("Please provide your query:", value=random_question)
-    if state_question and state_question.run_query:
-        run_query = state_question.run_query
+    if st.session_state.run_query:
+        run_query = st.session_state.run_query
         st.button("Run")
     else:
         run_query = st.button("Run")
-        state_question.run_query = run_query
-
-    raw_json_feedback = ""
+        st.session_state.run_query = run_query
 
-    with st.spinner("⌛️ &nbsp;&nbsp; Setting up..."):
-        if not haystack_is_ready():
-            st.error("🚫 &nbsp;&nbsp; Connection Error. Is Haystack running?")
-            run_query = False
+    # only show the spinner if we actually have to wait for the status check
+    if not haystack_was_ready():
+        with st.spinner("⌛️ &nbsp;&nbsp; Setting up..."):
+            if not haystack_is_ready():
+                st.error("🚫 &nbsp;&nbsp; Connection Error. Is Haystack running?")
+                run_query = False
 
     # Get results for query
     if run_query:
@@ -154,14 +177,15 @@ def main():
             st.write("**Relevance:** ", result["relevance"], "**Source:** ", result["source"])
             if eval_mode:
                 # Define columns for buttons
+                key = f"{result['document_id']}:{result['offset_start_in_doc']}:{count}"
                 button_col1, button_col2, button_col3, button_col4 = st.columns([1, 1, 1, 6])
-                if button_col1.button("👍", key=(result["context"] + str(count) + "1"), help="Correct answer"):
-                    raw_json_feedback = feedback_doc(
+                if button_col1.button("👍", key=f"{key}:up", help="Correct answer"):
+                    submit_feedback(
                         question, "true", result["document_id"], 1, "true", result["answer"], result["offset_start_in_doc"]
                     )
                     st.success("Thanks for your feedback")
-                if button_col2.button("👎", key=(result["context"] + str(count) + "2"), help="Wrong answer and wrong passage"):
-                    raw_json_feedback = feedback_doc(
+                if button_col2.button("👎", key=f"{key}:down", help="Wrong answer and wrong passage"):
+                    submit_feedback(
                         question,
                         "false",
                         result["document_id"],
@@ -171,8 +195,8 @@ def main():
                         result["offset_start_in_doc"],
                     )
                     st.success("Thanks for your feedback!")
-                if button_col3.button("👎👍", key=(result["context"] + str(count) + "3"), help="Wrong answer, but correct passage"):
-                    raw_json_feedback = feedback_doc(
+                if button_col3.button("👎👍", key=f"{key}:mixed", help="Wrong answer, but correct passage"):
+                    submit_feedback(
                         question, "false", result["document_id"], 1, "true", result["answer"], result["offset_start_in_doc"]
                     )
                     st.success("Thanks for your feedback!")